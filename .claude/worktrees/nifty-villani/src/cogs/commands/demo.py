@@ -1,10 +1,10 @@
 """Demo cog showcasing buttons, select menus, modals, and autocomplete."""
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 import discord
 from discord.ext import commands
 from discord import app_commands
-from discord.ui import Button, Select, View, Modal, TextInput
 
 from src.utils.embeds import success_embed, info_embed, error_embed
 
@@ -14,9 +14,20 @@ if TYPE_CHECKING:
 
 # Demo data for autocomplete
 DEMO_OPTIONS = ["Option 1", "Option 2", "Option 3", "Option 4", "Option 5"]
+_DEMO_LOWER = tuple((opt, opt.lower()) for opt in DEMO_OPTIONS)
 
 
-class DemoView(View):
+@lru_cache(maxsize=256)
+def _match_options(current: str) -> tuple[app_commands.Choice[str], ...]:
+    """Return the autocomplete choices matching an already-lowercased query."""
+    return tuple(
+        app_commands.Choice(name=opt, value=opt)
+        for opt, lowered in _DEMO_LOWER
+        if current in lowered
+    )[:25]  # Discord allows max 25 choices
+
+
+class DemoView(discord.ui.View):
     """A view containing buttons and select menus for demonstration."""
     
     def __init__(self) -> None:
@@ -27,7 +38,7 @@ class DemoView(View):
     async def primary_button(
         self, 
         interaction: discord.Interaction, 
-        button: Button
+        button: discord.ui.Button
     ) -> None:
         """Handle primary button click."""
         embed = success_embed("Button Clicked!", "You clicked the primary button!")
@@ -37,7 +48,7 @@ class DemoView(View):
     async def danger_button(
         self, 
         interaction: discord.Interaction, 
-        button: Button
+        button: discord.ui.Button
     ) -> None:
         """Handle danger button click."""
         embed = error_embed("Danger!", "You clicked the danger button!")
@@ -47,7 +58,7 @@ class DemoView(View):
     async def disabled_button(
         self, 
         interaction: discord.Interaction, 
-        button: Button
+        button: discord.ui.Button
     ) -> None:
         """This button is disabled and won't be called."""
         pass
@@ -63,7 +74,7 @@ class DemoView(View):
     async def demo_select(
         self, 
         interaction: discord.Interaction, 
-        select: Select
+        select: discord.ui.Select
     ) -> None:
         """Handle select menu selection."""
         selected = select.values[0]
@@ -74,17 +85,17 @@ class DemoView(View):
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
-class DemoModal(Modal, title="Demo Form"):
+class DemoModal(discord.ui.Modal, title="Demo Form"):
     """A modal form for demonstration."""
     
-    name_input = TextInput(
+    name_input = discord.ui.TextInput(
         label="Your Name",
         placeholder="Enter your name here...",
         required=True,
         max_length=100
     )
     
-    message_input = TextInput(
+    message_input = discord.ui.TextInput(
         label="Your Message",
         placeholder="Enter a message...",
         style=discord.TextStyle.long,
@@ -182,12 +193,7 @@ class Demo(commands.Cog):
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete handler for the option parameter."""
         # Filter options based on what the user has typed
-        filtered = [
-            app_commands.Choice(name=opt, value=opt)
-            for opt in DEMO_OPTIONS
-            if current.lower() in opt.lower()
-        ]
-        return filtered[:25]  # Discord allows max 25 choices
+        return list(_match_options(current.lower()))
     
     @commands.command(name="demo", aliases=["d"])
     @commands.has_permissions(administrator=True)
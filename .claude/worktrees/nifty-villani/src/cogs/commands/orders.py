@@ -23,6 +23,7 @@ ACTIVE_DRIVER_ROLE_ID = 1408456213733314592  # Replace with the Active Driver ro
 
 # --- Ticket configuration ---
 ORDER_CATEGORY_NAME = "ride-tickets"
+_ORDER_CATEGORY_KEY = ORDER_CATEGORY_NAME.lower()
 RIDE_TYPES: dict[str, str] = {
     "u_driver": "U-Driver",
     "u_getaway": "U-Getaway Driver",
@@ -32,73 +33,49 @@ RIDE_SELECT_ID = "ride_select"  # Components v2 deterministic custom_id
 CLOSE_TICKET_ID = "close_ticket"  # Components v2 deterministic custom_id
 CLAIM_TICKET_ID = "claim_ticket"  # Components v2 deterministic custom_id
 
+# Shared overwrite templates; PermissionOverwrite is never mutated after construction.
+_DENY_VIEW_OVERWRITE = discord.PermissionOverwrite(view_channel=False)
+_BOT_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=True,
+    read_message_history=True,
+    manage_messages=True,
+    manage_channels=True,
+)
+_PARTICIPANT_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True, send_messages=True, read_message_history=True, attach_files=True
+)
+
+# Ticket pings may only notify roles; shared since AllowedMentions is never mutated.
+_ROLE_ONLY_MENTIONS = discord.AllowedMentions(roles=True, users=False, everyone=False)
+
+# Channel-name slugging in one C-level pass; slugs per ride type are derived once from the labels.
+_SLUG_TABLE = str.maketrans(" ", "-")
+_RIDE_SLUGS: dict[str, str] = {key: label.lower().translate(_SLUG_TABLE) for key, label in RIDE_TYPES.items()}
+
+# Ride options are static; build them once instead of per RideSelect.
+_RIDE_OPTIONS: tuple[discord.SelectOption, ...] = tuple(
+    discord.SelectOption(label=label, value=key) for key, label in RIDE_TYPES.items()
+)
+
+# The ride panel never changes, so it is built once and sent as-is (send only serializes it).
+_RIDE_PANEL_EMBED = discord.Embed(
+    title="Request a Ride",
+    description=(
+        "Select your ride type below to open a private ticket.\n"
+        "A modal will collect pickup location and urgency."
+    ),
+    color=discord.Color.dark_embed(),
+)
+_RIDE_PANEL_EMBED.add_field(
+    name="Ride Type",
+    value="Use the dropdown attached to this message.",
+    inline=False,
+)
 
 def _short_id(length: int = 4) -> str:
-    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789"
-    # Use secrets for simple non-crypto but deterministic-free ID generation; avoids private discord utils.
-    return "".join(secrets.choice(alphabet) for _ in range(length))
-
-
-async def ensure_category(guild: discord.Guild) -> Optional[discord.CategoryChannel]:
-    """Get or create the category used for ride tickets."""
-    for category in guild.categories:
-        if category.name.lower() == ORDER_CATEGORY_NAME.lower():
-            return category
-    if not guild.me.guild_permissions.manage_channels:
-        logger.warning("Missing manage_channels; cannot create category in guild %s", guild.id)
-        return None
-    try:
-        return await guild.create_category(ORDER_CATEGORY_NAME, reason="Create ride ticket category")
-    except Exception as exc:  # pragma: no cover - discord API failure
-        logger.error("Failed to create category in guild %s: %s", guild.id, exc, exc_info=True)
-        return None
-
-
-async def create_ticket_channel(
-    guild: discord.Guild, user: discord.User | discord.Member, ride_label: str
-) -> Optional[discord.TextChannel]:
-    """Create a private ticket channel with enforced overwrites."""
-    category = await ensure_category(guild)
-    if category is None:
-        return None
-
-    channel_name = f"ride-{user.name.lower().replace(' ', '-')[:12]}-{ride_label.lower().replace(' ', '-')}-{_short_id()}"
-
-    overwrites = {
-        guild.default_role: discord.PermissionOverwrite(view_channel=False),
-        guild.me: discord.PermissionOverwrite(
-            view_channel=True,
-            send_messages=True,
-            read_message_history=True,
-            manage_messages=True,
-            manage_channels=True,
-        ),
-        user: discord.PermissionOverwrite(
-            view_channel=True, send_messages=True, read_message_history=True, attach_files=True
-        ),
-    }
-
-    active_driver_role = guild.get_role(ACTIVE_DRIVER_ROLE_ID)
-    if active_driver_role:
-        overwrites[active_driver_role] = discord.PermissionOverwrite(
-            view_channel=True, send_messages=True, read_message_history=True, attach_files=True
-        )
-
-    try:
-        channel = await guild.create_text_channel(
-            name=channel_name,
-            category=category,
-            overwrites=overwrites,
-            reason=f"Ride ticket for {user} ({ride_label})",
-        )
-        logger.info("Created ride ticket channel %s for user %s", channel.id, user.id)
-        return channel
-    except discord.Forbidden:
-        logger.warning("Missing permissions to create ride ticket in guild %s", guild.id)
-        return None
-    except Exception as exc:  # pragma: no cover - discord API failure
-        logger.error("Failed to create ride ticket in guild %s: %s", guild.id, exc, exc_info=True)
-        return None
+    # One urandom call; hex output is already a valid channel-name alphabet.
+    return secrets.token_hex((length + 1) // 2)[:length]
 
 
 class TicketActionsView(discord.ui.View):
@@ -209,8 +186,9 @@ class RideDetailsModal(discord.ui.Modal, title="Ride Details"):
     pickup_location: discord.ui.TextInput
     urgent: discord.ui.TextInput
 
-    def __init__(self, ride_key: str, ride_label: str) -> None:
+    def __init__(self, cog: Orders, ride_key: str, ride_label: str) -> None:
         super().__init__(timeout=None)
+        self.cog = cog
         self.ride_key = ride_key
         self.ride_label = ride_label
 
@@ -237,14 +215,19 @@ class RideDetailsModal(discord.ui.Modal, title="Ride Details"):
             await interaction.response.send_message("No guild context; cannot create ticket.", ephemeral=True)
             return
 
-        channel = await create_ticket_channel(guild, interaction.user, self.ride_label)
+        # Channel creation can outlast the 3s interaction window; acknowledge first.
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        # Resolve the driver role once so the overwrites and the ping use the same snapshot.
+        role = guild.get_role(ACTIVE_DRIVER_ROLE_ID)
+        channel = await self.cog.create_ticket_channel(guild, interaction.user, self.ride_key, role)
         if channel is None:
-            await interaction.response.send_message("Could not create your ticket channel.", ephemeral=True)
+            await interaction.followup.send("Could not create your ticket channel.", ephemeral=True)
             return
 
         urgency_raw = self.urgent.value.strip().lower()
         if urgency_raw not in {"yes", "no"}:
-            urgency_display = f"Invalid ({self.urgent.value}); treating as No"
+            urgency_display = f"Invalid ({discord.utils.escape_markdown(self.urgent.value)}); treating as No"
             urgency_value = "No"
         else:
             urgency_value = "Yes" if urgency_raw == "yes" else "No"
@@ -256,13 +239,13 @@ class RideDetailsModal(discord.ui.Modal, title="Ride Details"):
             color=discord.Color.dark_embed(),
         )
         embed.add_field(name="Ride Type", value=self.ride_label, inline=True)
-        embed.add_field(name="Pickup Location", value=self.pickup_location.value.strip(), inline=False)
+        pickup_location = discord.utils.escape_markdown(self.pickup_location.value.strip())
+        embed.add_field(name="Pickup Location", value=pickup_location, inline=False)
         embed.add_field(name="Urgent", value=urgency_display, inline=True)
         embed.add_field(name="Requested By", value=interaction.user.mention, inline=True)
         embed.add_field(name="Claimed By", value="Unclaimed", inline=True)
         embed.timestamp = discord.utils.utcnow()
 
-        role = guild.get_role(ACTIVE_DRIVER_ROLE_ID)
         mention = role.mention if role else ""
 
         # Components v2: action row (view) sent on the same payload as the embed.
@@ -271,7 +254,7 @@ class RideDetailsModal(discord.ui.Modal, title="Ride Details"):
             content=mention or "Active Driver role not configured.",
             embed=embed,
             view=view,
-            allowed_mentions=discord.AllowedMentions(roles=True, users=False, everyone=False),
+            allowed_mentions=_ROLE_ONLY_MENTIONS,
         )
         # Persist view across restarts.
         try:
@@ -279,7 +262,7 @@ class RideDetailsModal(discord.ui.Modal, title="Ride Details"):
         except Exception:
             logger.exception("Failed to persist ticket actions view for message %s", message.id)
 
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"Ticket created in {channel.mention}. A driver will assist you shortly.",
             ephemeral=True,
         )
@@ -288,18 +271,15 @@ class RideDetailsModal(discord.ui.Modal, title="Ride Details"):
 class RideSelect(discord.ui.Select):
     """Select menu for ride type selection."""
 
-    def __init__(self) -> None:
-        options = [
-            discord.SelectOption(label=label, value=key)
-            for key, label in RIDE_TYPES.items()
-        ]
+    def __init__(self, cog: Orders) -> None:
         super().__init__(
             placeholder="Choose your ride type",
             min_values=1,
             max_values=1,
-            options=options,
+            options=list(_RIDE_OPTIONS),  # Select owns its list; keep the shared options immutable.
             custom_id=RIDE_SELECT_ID,
         )
+        self.cog = cog
 
     async def callback(self, interaction: discord.Interaction) -> None:  # type: ignore[override]
         ride_key = self.values[0]
@@ -311,15 +291,15 @@ class RideSelect(discord.ui.Select):
             return
 
         # Components v2: a select menu triggers a modal; channel creation happens after modal submission.
-        await interaction.response.send_modal(RideDetailsModal(ride_key=ride_key, ride_label=ride_label))
+        await interaction.response.send_modal(RideDetailsModal(self.cog, ride_key=ride_key, ride_label=ride_label))
 
 
 class RidePanelView(discord.ui.View):
     """Persistent view containing the ride selection menu."""
 
-    def __init__(self) -> None:
+    def __init__(self, cog: Orders) -> None:
         super().__init__(timeout=None)
-        self.add_item(RideSelect())
+        self.add_item(RideSelect(cog))
 
 
 class Orders(commands.Cog):
@@ -327,38 +307,134 @@ class Orders(commands.Cog):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        # guild_id -> ride ticket category id, so lookups skip the guild.categories scan.
+        self._category_cache: dict[int, int] = {}
+        self._category_locks: dict[int, asyncio.Lock] = {}
+        # guild_id -> shared base overwrites (everyone, bot, driver role); per-ticket user entries are added to a copy.
+        self._overwrite_templates: dict[int, dict[discord.Role | discord.Member, discord.PermissionOverwrite]] = {}
+        # Persistent view shared by every posted ride panel; it only holds a reference back to this cog.
+        self.panel_view = RidePanelView(self)
 
     async def cog_load(self) -> None:
         # Register persistent views so components keep working after restarts.
-        self.bot.add_view(RidePanelView())
+        self.bot.add_view(self.panel_view)
         self.bot.add_view(TicketActionsView())
 
+    async def cog_unload(self) -> None:
+        # Stop the panel from routing to this instance and drop its per-guild state.
+        self.panel_view.stop()
+        self._category_cache.clear()
+        self._category_locks.clear()
+        self._overwrite_templates.clear()
+
+    def _cached_category(self, guild: discord.Guild) -> Optional[discord.CategoryChannel]:
+        """Return the cached ride ticket category if it still exists."""
+        cached_id = self._category_cache.get(guild.id)
+        if cached_id is not None:
+            cached = guild.get_channel(cached_id)
+            if isinstance(cached, discord.CategoryChannel):
+                return cached
+            self._category_cache.pop(guild.id, None)
+        return None
+
+    async def ensure_category(self, guild: discord.Guild) -> Optional[discord.CategoryChannel]:
+        """Get or create the category used for ride tickets."""
+        category = self._cached_category(guild)
+        if category is not None:
+            return category
+
+        # Serialize scan + create per guild so concurrent tickets cannot create duplicate categories.
+        async with self._category_locks.setdefault(guild.id, asyncio.Lock()):
+            category = self._cached_category(guild)
+            if category is not None:
+                return category
+
+            category = discord.utils.find(lambda c: c.name.lower() == _ORDER_CATEGORY_KEY, guild.categories)
+            if category is not None:
+                self._category_cache[guild.id] = category.id
+                return category
+            if not guild.me.guild_permissions.manage_channels:
+                logger.warning("Missing manage_channels; cannot create category in guild %s", guild.id)
+                return None
+            try:
+                category = await guild.create_category(ORDER_CATEGORY_NAME, reason="Create ride ticket category")
+                self._category_cache[guild.id] = category.id
+                return category
+            except Exception as exc:  # pragma: no cover - discord API failure
+                logger.error("Failed to create category in guild %s: %s", guild.id, exc, exc_info=True)
+                return None
+
+    def _base_overwrites(
+        self, guild: discord.Guild, driver_role: Optional[discord.Role]
+    ) -> dict[discord.Role | discord.Member, discord.PermissionOverwrite]:
+        """Return the cached per-guild overwrite template shared by every ride ticket."""
+        template = self._overwrite_templates.get(guild.id)
+        if template is None:
+            template = {guild.default_role: _DENY_VIEW_OVERWRITE, guild.me: _BOT_OVERWRITE}
+            if driver_role:
+                template[driver_role] = _PARTICIPANT_OVERWRITE
+            self._overwrite_templates[guild.id] = template
+        return template
+
+    async def create_ticket_channel(
+        self,
+        guild: discord.Guild,
+        user: discord.User | discord.Member,
+        ride_key: str,
+        driver_role: Optional[discord.Role],
+    ) -> Optional[discord.TextChannel]:
+        """Create a private ticket channel with enforced overwrites."""
+        category = await self.ensure_category(guild)
+        if category is None:
+            return None
+
+        ride_label = RIDE_TYPES.get(ride_key, "Unknown")
+        base_username = user.name[:12].lower().translate(_SLUG_TABLE)
+        channel_name = f"ride-{base_username}-{_RIDE_SLUGS.get(ride_key, 'unknown')}-{_short_id()}"
+
+        overwrites = dict(self._base_overwrites(guild, driver_role))
+        overwrites[user] = _PARTICIPANT_OVERWRITE
+
+        try:
+            channel = await guild.create_text_channel(
+                name=channel_name,
+                category=category,
+                overwrites=overwrites,
+                reason=f"Ride ticket for {user} ({ride_label})",
+            )
+            logger.info("Created ride ticket channel %s for user %s", channel.id, user.id)
+            return channel
+        except discord.Forbidden:
+            logger.warning("Missing permissions to create ride ticket in guild %s", guild.id)
+            return None
+        except Exception as exc:  # pragma: no cover - discord API failure
+            logger.error("Failed to create ride ticket in guild %s: %s", guild.id, exc, exc_info=True)
+            return None
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        # Drop the cached ride ticket category if it was the one deleted.
+        if self._category_cache.get(channel.guild.id) == channel.id:
+            del self._category_cache[channel.guild.id]
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        if role.id == ACTIVE_DRIVER_ROLE_ID:
+            self._overwrite_templates.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        if role.id == ACTIVE_DRIVER_ROLE_ID:
+            self._overwrite_templates.pop(role.guild.id, None)
+
     @app_commands.command(name="ride-panel", description="Post the ride ticket panel")
     @app_commands.guilds(discord.Object(id=GUILD_ID))
     @app_commands.default_permissions(administrator=True)
     async def ride_panel(self, interaction: discord.Interaction) -> None:
-        embed = discord.Embed(
-            title="Request a Ride",
-            description=(
-                "Select your ride type below to open a private ticket.\n"
-                "A modal will collect pickup location and urgency."
-            ),
-            color=discord.Color.dark_embed(),
-        )
-        embed.add_field(
-            name="Ride Type",
-            value="Use the dropdown attached to this message.",
-            inline=False,
-        )
-
-        view = RidePanelView()
+        await interaction.response.defer(ephemeral=True)
         # Components must live on the message itself; Discord does not permit placing them inside embed fields.
-        await interaction.channel.send(embed=embed, view=view)
-
-        if interaction.response.is_done():
-            await interaction.followup.send("Ride panel posted.", ephemeral=True)
-        else:
-            await interaction.response.send_message("Ride panel posted.", ephemeral=True)
+        await interaction.channel.send(embed=_RIDE_PANEL_EMBED, view=self.panel_view)
+        await interaction.followup.send("Ride panel posted.", ephemeral=True)
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -371,8 +447,8 @@ class TicketBot(commands.Bot):
     def __init__(self) -> None:
         intents = discord.Intents.default()
         intents.guilds = True
-        intents.members = True
-        super().__init__(command_prefix="!", intents=intents)
+        # Ride tickets only read members from interaction payloads, so skip the member cache.
+        super().__init__(command_prefix="!", intents=intents, chunk_guilds_at_startup=False)
 
     async def setup_hook(self) -> None:
         await self.add_cog(Orders(self))
@@ -381,6 +457,12 @@ class TicketBot(commands.Bot):
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
+    try:
+        import uvloop  # Optional: faster event loop on Linux/macOS.
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     bot = TicketBot()
     bot.run(BOT_TOKEN)
 
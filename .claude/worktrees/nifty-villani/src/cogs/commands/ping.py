@@ -10,6 +10,8 @@ from src.utils.embeds import info_embed
 if TYPE_CHECKING:
     from src.bot import Bot
 
+PING_TITLE = "🏓 Pong!"
+
 
 class Ping(commands.Cog):
     """Ping command to check bot latency."""
@@ -18,35 +20,22 @@ class Ping(commands.Cog):
         """Initialize the Ping cog."""
         self.bot = bot
     
+    def ping_embed(self) -> discord.Embed:
+        """Build the latency embed shared by the slash and prefix commands."""
+        latency = round(self.bot.latency * 1000, 2)
+        return info_embed(PING_TITLE, f"Bot latency: **{latency}ms**")
+    
     @app_commands.command(name="ping", description="Check the bot's latency (Admin only)")
     @app_commands.checks.has_permissions(administrator=True)
     async def ping_slash(self, interaction: discord.Interaction) -> None:
         """Slash command to check bot latency."""
-        # Calculate latency
-        latency = round(self.bot.latency * 1000, 2)
-        
-        # Create embed response
-        embed = info_embed(
-            "🏓 Pong!",
-            f"Bot latency: **{latency}ms**"
-        )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=False)
+        await interaction.response.send_message(embed=self.ping_embed(), ephemeral=False)
     
     @commands.command(name="ping", aliases=["p"])
     @commands.has_permissions(administrator=True)
     async def ping_prefix(self, ctx: commands.Context) -> None:
         """Prefix command to check bot latency."""
-        # Calculate latency
-        latency = round(self.bot.latency * 1000, 2)
-        
-        # Create embed response
-        embed = info_embed(
-            "🏓 Pong!",
-            f"Bot latency: **{latency}ms**"
-        )
-        
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self.ping_embed())
 
 
 async def setup(bot: "Bot") -> None:
@@ -2,7 +2,7 @@
 
 import logging
 import traceback
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Optional
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -14,6 +14,68 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+EmbedBuilder = Callable[[Any], discord.Embed]
+
+# Error embeds with no per-error content are built once; sending only serializes them
+MISSING_PERMISSIONS_EMBED = error_embed(
+    "Missing Permissions",
+    "You don't have permission to use this command."
+)
+GUILD_NOT_FOUND_EMBED = error_embed("Guild Not Found", "The specified guild could not be found.")
+MEMBER_NOT_FOUND_EMBED = error_embed("Member Not Found", "The specified member could not be found.")
+UNEXPECTED_ERROR_EMBED = error_embed(
+    "An Error Occurred",
+    "An unexpected error occurred. Please try again later."
+)
+
+# Exception type -> embed builder for prefix command errors
+PREFIX_ERROR_EMBEDS: dict[type[Exception], EmbedBuilder] = {
+    commands.MissingRequiredArgument: lambda error: error_embed(
+        "Missing Required Argument",
+        f"You're missing the `{error.param.name}` argument."
+    ),
+    commands.MissingPermissions: lambda error: MISSING_PERMISSIONS_EMBED,
+    commands.BotMissingPermissions: lambda error: error_embed(
+        "Bot Missing Permissions",
+        f"I need the following permissions: {', '.join(error.missing_permissions)}"
+    ),
+    commands.CommandOnCooldown: lambda error: error_embed(
+        "Command on Cooldown",
+        f"Please wait {error.retry_after:.2f} seconds before using this command again."
+    ),
+    commands.GuildNotFound: lambda error: GUILD_NOT_FOUND_EMBED,
+    commands.MemberNotFound: lambda error: MEMBER_NOT_FOUND_EMBED,
+}
+
+# Exception type -> embed builder for slash command errors
+APP_ERROR_EMBEDS: dict[type[Exception], EmbedBuilder] = {
+    app_commands.CommandOnCooldown: lambda error: error_embed(
+        "Command on Cooldown",
+        f"Please wait {error.retry_after:.2f} seconds before using this command again."
+    ),
+    app_commands.MissingPermissions: lambda error: MISSING_PERMISSIONS_EMBED,
+    app_commands.BotMissingPermissions: lambda error: error_embed(
+        "Bot Missing Permissions",
+        f"I need the following permissions: {', '.join(error.missing_permissions)}"
+    ),
+}
+
+
+def find_embed_builder(
+    builders: dict[type[Exception], EmbedBuilder],
+    error: Exception
+) -> Optional[EmbedBuilder]:
+    """
+    Find the embed builder for an error.
+    
+    The exact type is a single dict hit; subclasses fall back to walking the MRO.
+    """
+    for cls in type(error).__mro__:
+        builder = builders.get(cls)
+        if builder is not None:
+            return builder
+    return None
+
 
 class ErrorHandler(commands.Cog):
     """Handles errors for prefix and slash commands."""
@@ -22,6 +84,15 @@ class ErrorHandler(commands.Cog):
         """Initialize the ErrorHandler cog."""
         self.bot = bot
     
+    @staticmethod
+    async def reply(interaction: discord.Interaction, embed: discord.Embed) -> None:
+        """Send an ephemeral embed as the initial response, or as a followup if already responded."""
+        if interaction.response.is_done():
+            send = interaction.followup.send
+        else:
+            send = interaction.response.send_message
+        await send(embed=embed, ephemeral=True)
+    
     @commands.Cog.listener()
     async def on_command_error(
         self, 
@@ -38,56 +109,14 @@ class ErrorHandler(commands.Cog):
             return
         
         # Handle specific errors
-        if isinstance(error, commands.MissingRequiredArgument):
-            embed = error_embed(
-                "Missing Required Argument",
-                f"You're missing the `{error.param.name}` argument."
-            )
-            await ctx.send(embed=embed)
-            return
-        
-        if isinstance(error, commands.MissingPermissions):
-            embed = error_embed(
-                "Missing Permissions",
-                "You don't have permission to use this command."
-            )
-            await ctx.send(embed=embed)
-            return
-        
-        if isinstance(error, commands.BotMissingPermissions):
-            missing = ", ".join(error.missing_permissions)
-            embed = error_embed(
-                "Bot Missing Permissions",
-                f"I need the following permissions: {missing}"
-            )
-            await ctx.send(embed=embed)
-            return
-        
-        if isinstance(error, commands.CommandOnCooldown):
-            embed = error_embed(
-                "Command on Cooldown",
-                f"Please wait {error.retry_after:.2f} seconds before using this command again."
-            )
-            await ctx.send(embed=embed)
-            return
-        
-        if isinstance(error, commands.GuildNotFound):
-            embed = error_embed("Guild Not Found", "The specified guild could not be found.")
-            await ctx.send(embed=embed)
-            return
-        
-        if isinstance(error, commands.MemberNotFound):
-            embed = error_embed("Member Not Found", "The specified member could not be found.")
-            await ctx.send(embed=embed)
+        builder = find_embed_builder(PREFIX_ERROR_EMBEDS, error)
+        if builder is not None:
+            await ctx.send(embed=builder(error))
             return
         
         # Log unexpected errors
-        logger.error(f"Unexpected error in command {ctx.command}: {error}", exc_info=error)
-        embed = error_embed(
-            "An Error Occurred",
-            "An unexpected error occurred. Please try again later."
-        )
-        await ctx.send(embed=embed)
+        logger.error("Unexpected error in command %s: %s", ctx.command, error, exc_info=error)
+        await ctx.send(embed=UNEXPECTED_ERROR_EMBED)
     
     @commands.Cog.listener()
     async def on_app_command_error(
@@ -96,59 +125,20 @@ class ErrorHandler(commands.Cog):
         error: app_commands.AppCommandError
     ) -> None:
         """Handle errors for slash commands."""
-        # Handle command on cooldown
-        if isinstance(error, app_commands.CommandOnCooldown):
-            embed = error_embed(
-                "Command on Cooldown",
-                f"Please wait {error.retry_after:.2f} seconds before using this command again."
-            )
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        
-        # Handle missing permissions
-        if isinstance(error, app_commands.MissingPermissions):
-            embed = error_embed(
-                "Missing Permissions",
-                "You don't have permission to use this command."
-            )
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        
-        # Handle bot missing permissions
-        if isinstance(error, app_commands.BotMissingPermissions):
-            missing = ", ".join(error.missing_permissions)
-            embed = error_embed(
-                "Bot Missing Permissions",
-                f"I need the following permissions: {missing}"
-            )
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+        # Ignore commands that weren't found
+        if isinstance(error, app_commands.CommandNotFound):
             return
         
-        # Handle command not found
-        if isinstance(error, app_commands.CommandNotFound):
+        # Handle specific errors
+        builder = find_embed_builder(APP_ERROR_EMBEDS, error)
+        if builder is not None:
+            await self.reply(interaction, builder(error))
             return
         
         # Log unexpected errors
-        logger.error(f"Unexpected error in app command: {error}", exc_info=error)
-        embed = error_embed(
-            "An Error Occurred",
-            "An unexpected error occurred. Please try again later."
-        )
-        
+        logger.error("Unexpected error in app command: %s", error, exc_info=error)
         try:
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+            await self.reply(interaction, UNEXPECTED_ERROR_EMBED)
         except discord.HTTPException:
             logger.error("Failed to send error message to user")
 
@@ -21,12 +21,16 @@ class Events(commands.Cog):
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         """Called when the bot is ready."""
-        assert self.bot.user is not None
-        logger.info(f"{self.bot.user.name} is ready!")
-        logger.info(f"Bot ID: {self.bot.user.id}")
-        logger.info(f"Discord.py version: {discord.__version__}")
-        logger.info(f"Connected to {len(self.bot.guilds)} guild(s)")
-        logger.info(f"Bot is visible to {len(self.bot.users)} user(s)")
+        user = self.bot.user
+        assert user is not None
+        logger.info(
+            "%s is ready! (ID: %s, discord.py %s) - connected to %d guild(s), visible to %d user(s)",
+            user.name,
+            user.id,
+            discord.__version__,
+            len(self.bot.guilds),
+            len(self.bot.users),
+        )
 
         # Start rotating presence
         self.bot.start_status_rotation()
@@ -36,12 +40,12 @@ class Events(commands.Cog):
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """Called when the bot joins a new guild."""
-        logger.info(f"Joined guild: {guild.name} (ID: {guild.id})")
+        logger.info("Joined guild: %s (ID: %s)", guild.name, guild.id)
     
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild) -> None:
         """Called when the bot leaves a guild."""
-        logger.info(f"Left guild: {guild.name} (ID: {guild.id})")
+        logger.info("Left guild: %s (ID: %s)", guild.name, guild.id)
 
 
 async def setup(bot: "Bot") -> None:
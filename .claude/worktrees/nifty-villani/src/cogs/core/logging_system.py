@@ -1,11 +1,15 @@
 """Logging system for server events."""
 
+import asyncio
 import logging
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Optional
 import discord
 from discord.ext import commands
 
-from src.utils.embeds import info_embed, warning_embed, BRAND_PRIMARY
+from src.utils.embeds import info_embed, warning_embed
+from src.utils.ui import account_created_timestamp
 
 if TYPE_CHECKING:
     from src.bot import Bot
@@ -16,6 +20,56 @@ logger = logging.getLogger(__name__)
 LOGS_CATEGORY_NAME = "Server Logs"
 MEMBER_LOGS_CHANNEL_NAME = "member-logs"
 MESSAGE_LOGS_CHANNEL_NAME = "message-logs"
+LOGS_CHANNEL_NAMES = (MEMBER_LOGS_CHANNEL_NAME, MESSAGE_LOGS_CHANNEL_NAME)
+
+# Logs channel overwrites (hidden from @everyone, writable by the bot); only read when creating channels
+LOGS_EVERYONE_OVERWRITE = discord.PermissionOverwrite(view_channel=False)
+LOGS_BOT_OVERWRITE = discord.PermissionOverwrite(view_channel=True, send_messages=True)
+
+# Shortest role mention ("<@&" + 17-digit id + ">") plus the ", " separator
+MIN_ROLE_MENTION_LENGTH = 23
+
+# Discord limits per message: embed count and combined embed characters
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Seconds to collect log embeds before sending them together
+SEND_BATCH_WINDOW = 0.5
+
+# Seconds cog_unload waits for queued log embeds to be sent before dropping them
+UNLOAD_FLUSH_TIMEOUT = 5.0
+
+# Seconds to wait before retrying logs channel creation after it fails in a guild
+CREATION_RETRY_DELAY = 300
+
+
+def format_attachments(attachments: list[discord.Attachment]) -> str:
+    """List attachments one per line, stopping before the 1024-character field limit."""
+    lines = []
+    length = 0
+    for att in attachments:
+        line = f"- {att.filename} ({att.size} bytes)"
+        length += len(line) + 1
+        if length > 1024 - len("\n..."):
+            lines.append("...")
+            break
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class GuildLogState:
+    """Per-guild logs channel ids, creation backoff, and cached send permissions."""
+    
+    __slots__ = ("category_id", "channel_ids", "retry_at", "lock", "send_permissions")
+    
+    def __init__(self) -> None:
+        """Initialize empty state for a guild."""
+        # Ids are resolved through the guild on use so deleted channels never linger
+        self.category_id: Optional[int] = None
+        self.channel_ids: dict[str, int] = {}  # channel name -> channel id
+        self.retry_at = 0.0  # monotonic time creation may be retried after a failure
+        self.lock = asyncio.Lock()  # held around scan/create
+        self.send_permissions: dict[int, bool] = {}  # channel_id -> bot can send
 
 
 class LoggingSystem(commands.Cog):
@@ -24,36 +78,183 @@ class LoggingSystem(commands.Cog):
     def __init__(self, bot: "Bot") -> None:
         """Initialize the LoggingSystem cog."""
         self.bot = bot
-        self.logs_category_cache: dict[int, Optional[discord.CategoryChannel]] = {}
-        self.member_logs_cache: dict[int, Optional[discord.TextChannel]] = {}
-        self.message_logs_cache: dict[int, Optional[discord.TextChannel]] = {}
+        self.guild_states: dict[int, GuildLogState] = {}
+        self.pending_logs: dict[int, deque[discord.Embed]] = {}  # channel_id -> embeds waiting to send
+        self.send_tasks: dict[int, asyncio.Task] = {}  # channel_id -> task flushing pending_logs
+    
+    async def cog_unload(self) -> None:
+        """Give running log senders a chance to drain their queues, then stop them."""
+        tasks = list(self.send_tasks.values())
+        if not tasks:
+            return
+        # Listeners are already removed, so the queues only shrink from here
+        _, still_running = await asyncio.wait(tasks, timeout=UNLOAD_FLUSH_TIMEOUT)
+        dropped = sum(len(pending) for pending in self.pending_logs.values())
+        for task in still_running:
+            task.cancel()
+        if dropped:
+            logger.warning("Dropped %d queued log embed(s) on unload", dropped)
+    
+    def guild_state(self, guild: discord.Guild) -> GuildLogState:
+        """Get the logging state for a guild, creating it on first use."""
+        state = self.guild_states.get(guild.id)
+        if state is None:
+            state = self.guild_states[guild.id] = GuildLogState()
+        return state
+    
+    def can_send(self, channel: discord.TextChannel) -> bool:
+        """Check whether the bot can send messages in a logs channel, cached per guild."""
+        send_permissions = self.guild_state(channel.guild).send_permissions
+        allowed = send_permissions.get(channel.id)
+        if allowed is None:
+            allowed = channel.permissions_for(channel.guild.me).send_messages
+            send_permissions[channel.id] = allowed
+        return allowed
+    
+    def clear_send_permissions(self, guild: discord.Guild) -> None:
+        """Drop a guild's cached send permissions."""
+        state = self.guild_states.get(guild.id)
+        if state is not None:
+            state.send_permissions.clear()
+    
+    def prewarm(self, guild: discord.Guild) -> None:
+        """Seed a guild's cached logs ids from one pass over its channels."""
+        state = self.guild_state(guild)
+        for channel in guild.channels:
+            if isinstance(channel, discord.TextChannel):
+                if channel.name in LOGS_CHANNEL_NAMES:
+                    state.channel_ids.setdefault(channel.name, channel.id)
+            elif isinstance(channel, discord.CategoryChannel):
+                if channel.name == LOGS_CATEGORY_NAME and state.category_id is None:
+                    state.category_id = channel.id
+    
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """Resolve existing logs channels up front so events start on a cache hit."""
+        for guild in self.bot.guilds:
+            self.prewarm(guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        """Resolve existing logs channels in a newly joined guild."""
+        self.prewarm(guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        """Pick up a logs channel created outside the bot (e.g. during a creation backoff)."""
+        if isinstance(channel, discord.TextChannel) and channel.name in LOGS_CHANNEL_NAMES:
+            self.guild_state(channel.guild).channel_ids.setdefault(channel.name, channel.id)
     
-    async def get_or_create_logs_category(self, guild: discord.Guild) -> Optional[discord.CategoryChannel]:
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """Drop cached ids for a deleted logs category or channel."""
+        state = self.guild_states.get(channel.guild.id)
+        if state is None:
+            return
+        if state.category_id == channel.id:
+            state.category_id = None
+        elif state.channel_ids.get(channel.name) == channel.id:
+            del state.channel_ids[channel.name]
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """Forget all per-guild state when the bot leaves a guild."""
+        self.guild_states.pop(guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self,
+        before: discord.abc.GuildChannel,
+        after: discord.abc.GuildChannel
+    ) -> None:
+        """Drop cached send permissions when a channel's overwrites may have changed."""
+        self.clear_send_permissions(after.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """Drop cached send permissions when a role changes."""
+        self.clear_send_permissions(after.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """Drop cached send permissions when a role is deleted."""
+        self.clear_send_permissions(role.guild)
+    
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        """Drop cached send permissions when the bot's own roles change."""
+        if after.id == after.guild.me.id and before.roles != after.roles:
+            self.clear_send_permissions(after.guild)
+    
+    def queue_log(self, channel: discord.TextChannel, embed: discord.Embed) -> None:
+        """Queue a log embed; embeds queued close together are sent as one message."""
+        pending = self.pending_logs.get(channel.id)
+        if pending is None:
+            pending = self.pending_logs[channel.id] = deque()
+        pending.append(embed)
+        
+        if channel.id not in self.send_tasks:
+            self.send_tasks[channel.id] = asyncio.create_task(self.flush_logs(channel, pending))
+    
+    async def flush_logs(self, channel: discord.TextChannel, pending: deque[discord.Embed]) -> None:
+        """Send a channel's queued embeds in batches until none are left."""
+        try:
+            await asyncio.sleep(SEND_BATCH_WINDOW)
+            while pending:
+                batch = [pending.popleft()]
+                size = len(batch[0])
+                while (
+                    pending
+                    and len(batch) < MAX_EMBEDS_PER_MESSAGE
+                    and size + len(pending[0]) <= MAX_EMBED_CHARS_PER_MESSAGE
+                ):
+                    embed = pending.popleft()
+                    size += len(embed)
+                    batch.append(embed)
+                
+                # Any failure only loses this batch; the rest of the queue is still sent
+                try:
+                    await channel.send(embeds=batch)
+                except Exception as e:
+                    logger.error("Failed to send %d log embed(s) to %s: %s", len(batch), channel, e, exc_info=True)
+        finally:
+            del self.send_tasks[channel.id]
+            if not pending:
+                del self.pending_logs[channel.id]
+    
+    async def get_or_create_logs_category(
+        self,
+        guild: discord.Guild,
+        state: GuildLogState
+    ) -> Optional[discord.CategoryChannel]:
         """
         Get or create the Server Logs category.
         
+        Only called from get_or_create_logs_channel, under the guild's state lock.
+        
         Args:
             guild: The guild to get/create the category in
+            state: The guild's logging state
             
         Returns:
             The category channel, or None if creation failed
         """
-        # Check cache first
-        if guild.id in self.logs_category_cache:
-            cached = self.logs_category_cache[guild.id]
-            if cached and cached in guild.categories:
+        # Check cache first (get_channel is a dict lookup, unlike scanning guild.categories)
+        if state.category_id is not None:
+            cached = guild.get_channel(state.category_id)
+            if isinstance(cached, discord.CategoryChannel):
                 return cached
+            state.category_id = None
         
         # Try to find existing category
         for category in guild.categories:
             if category.name == LOGS_CATEGORY_NAME:
-                self.logs_category_cache[guild.id] = category
+                state.category_id = category.id
                 return category
         
         # Create new category if we have permission
         if not guild.me.guild_permissions.manage_channels:
-            logger.warning(f"Bot lacks manage_channels permission in {guild.name}. Cannot create logs category.")
-            self.logs_category_cache[guild.id] = None
+            logger.warning("Bot lacks manage_channels permission in %s. Cannot create logs category.", guild.name)
             return None
         
         try:
@@ -61,19 +262,34 @@ class LoggingSystem(commands.Cog):
                 LOGS_CATEGORY_NAME,
                 reason="Automatic logs category creation"
             )
-            self.logs_category_cache[guild.id] = category
-            logger.info(f"Created logs category '{LOGS_CATEGORY_NAME}' in {guild.name}")
+            state.category_id = category.id
+            logger.info("Created logs category '%s' in %s", LOGS_CATEGORY_NAME, guild.name)
             return category
         except discord.HTTPException as e:
-            logger.error(f"Failed to create logs category in {guild.name}: {e}", exc_info=True)
-            self.logs_category_cache[guild.id] = None
+            logger.error("Failed to create logs category in %s: %s", guild.name, e, exc_info=True)
+            return None
+    
+    @staticmethod
+    def cached_logs_channel(
+        guild: discord.Guild,
+        state: GuildLogState,
+        channel_name: str
+    ) -> Optional[discord.TextChannel]:
+        """Resolve a cached logs channel id, dropping it if the channel is gone."""
+        # get_channel is a dict lookup, unlike scanning guild.channels
+        channel_id = state.channel_ids.get(channel_name)
+        if channel_id is None:
             return None
+        cached = guild.get_channel(channel_id)
+        if isinstance(cached, discord.TextChannel):
+            return cached
+        del state.channel_ids[channel_name]
+        return None
     
     async def get_or_create_logs_channel(
         self,
         guild: discord.Guild,
-        channel_name: str,
-        cache: dict[int, Optional[discord.TextChannel]]
+        channel_name: str
     ) -> Optional[discord.TextChannel]:
         """
         Get or create a logs channel.
@@ -81,67 +297,67 @@ class LoggingSystem(commands.Cog):
         Args:
             guild: The guild to get/create the channel in
             channel_name: Name of the channel to create
-            cache: Cache dictionary for the channel type
             
         Returns:
             The text channel, or None if creation failed
         """
-        # Check cache first
-        if guild.id in cache:
-            cached = cache[guild.id]
-            if cached and cached in guild.channels:
-                return cached
-        
-        # Try to find existing channel
-        for channel in guild.channels:
-            if isinstance(channel, discord.TextChannel) and channel.name == channel_name:
-                cache[guild.id] = channel
-                return channel
-        
-        # Get or create category
-        category = await self.get_or_create_logs_category(guild)
+        state = self.guild_state(guild)
+        cached = self.cached_logs_channel(guild, state, channel_name)
+        if cached is not None:
+            return cached
         
-        # Create new channel if we have permission
-        if not guild.me.guild_permissions.manage_channels:
-            logger.warning(f"Bot lacks manage_channels permission in {guild.name}. Cannot create logs channel.")
-            cache[guild.id] = None
-            return None
-        
-        try:
-            overwrites = {
-                guild.default_role: discord.PermissionOverwrite(view_channel=False),
-                guild.me: discord.PermissionOverwrite(view_channel=True, send_messages=True)
-            }
+        # One coroutine per guild does the scan/create; the rest wait and reuse its result
+        async with state.lock:
+            cached = self.cached_logs_channel(guild, state, channel_name)
+            if cached is not None:
+                return cached
             
-            channel = await guild.create_text_channel(
-                channel_name,
-                category=category,
-                overwrites=overwrites,
-                reason="Automatic logs channel creation"
-            )
-            cache[guild.id] = channel
-            logger.info(f"Created logs channel '{channel_name}' in {guild.name}")
-            return channel
-        except discord.HTTPException as e:
-            logger.error(f"Failed to create logs channel '{channel_name}' in {guild.name}: {e}", exc_info=True)
-            cache[guild.id] = None
-            return None
+            # Skip the scan and REST calls while a recent failure is backing off
+            if time.monotonic() < state.retry_at:
+                return None
+            
+            # Try to find existing channel
+            for channel in guild.channels:
+                if isinstance(channel, discord.TextChannel) and channel.name == channel_name:
+                    state.channel_ids[channel_name] = channel.id
+                    return channel
+            
+            # Get or create category
+            category = await self.get_or_create_logs_category(guild, state)
+            
+            # Create new channel if we have permission
+            if not guild.me.guild_permissions.manage_channels:
+                logger.warning("Bot lacks manage_channels permission in %s. Cannot create logs channel.", guild.name)
+                state.retry_at = time.monotonic() + CREATION_RETRY_DELAY
+                return None
+            
+            try:
+                overwrites = {
+                    guild.default_role: LOGS_EVERYONE_OVERWRITE,
+                    guild.me: LOGS_BOT_OVERWRITE
+                }
+                
+                channel = await guild.create_text_channel(
+                    channel_name,
+                    category=category,
+                    overwrites=overwrites,
+                    reason="Automatic logs channel creation"
+                )
+                state.channel_ids[channel_name] = channel.id
+                logger.info("Created logs channel '%s' in %s", channel_name, guild.name)
+                return channel
+            except discord.HTTPException as e:
+                logger.error("Failed to create logs channel '%s' in %s: %s", channel_name, guild.name, e, exc_info=True)
+                state.retry_at = time.monotonic() + CREATION_RETRY_DELAY
+                return None
     
     async def get_member_logs_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
         """Get or create the member-logs channel."""
-        return await self.get_or_create_logs_channel(
-            guild,
-            MEMBER_LOGS_CHANNEL_NAME,
-            self.member_logs_cache
-        )
+        return await self.get_or_create_logs_channel(guild, MEMBER_LOGS_CHANNEL_NAME)
     
     async def get_message_logs_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
         """Get or create the message-logs channel."""
-        return await self.get_or_create_logs_channel(
-            guild,
-            MESSAGE_LOGS_CHANNEL_NAME,
-            self.message_logs_cache
-        )
+        return await self.get_or_create_logs_channel(guild, MESSAGE_LOGS_CHANNEL_NAME)
     
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
@@ -152,18 +368,20 @@ class LoggingSystem(commands.Cog):
                 return
             
             # Check permissions
-            if not channel.permissions_for(member.guild.me).send_messages:
+            if not self.can_send(channel):
                 return
             
             embed = info_embed(
                 title="Member Joined",
-                description=f"{member.mention} (`{member.name}`)"
+                description=f"{member.mention} (`{member.name}`)",
+                footer=f"User ID: {member.id}",
+                timestamp=discord.utils.utcnow()
             )
             embed.set_thumbnail(url=member.display_avatar.url)
             embed.add_field(name="User ID", value=f"`{member.id}`", inline=True)
             embed.add_field(
                 name="Account Created",
-                value=f"<t:{int(member.created_at.timestamp())}:R>",
+                value=account_created_timestamp(member),
                 inline=True
             )
             embed.add_field(
@@ -171,14 +389,10 @@ class LoggingSystem(commands.Cog):
                 value=f"{member.guild.member_count:,}",
                 inline=True
             )
-            embed.color = BRAND_PRIMARY
-            embed.set_footer(text=f"User ID: {member.id}")
-            embed.timestamp = discord.utils.utcnow()
-            
-            await channel.send(embed=embed)
+            self.queue_log(channel, embed)
             
         except Exception as e:
-            logger.error(f"Failed to log member join for {member}: {e}", exc_info=True)
+            logger.error("Failed to log member join for %s: %s", member, e, exc_info=True)
     
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
@@ -189,16 +403,24 @@ class LoggingSystem(commands.Cog):
                 return
             
             # Check permissions
-            if not channel.permissions_for(member.guild.me).send_messages:
+            if not self.can_send(channel):
                 return
             
-            # Get member roles (excluding @everyone)
-            roles = [role.mention for role in member.roles if role != member.guild.default_role]
-            roles_str = ", ".join(roles) if roles else "None"
+            # Get member roles (member.roles always starts with @everyone)
+            roles = member.roles[1:]
+            if not roles:
+                roles_str = "None"
+            elif len(roles) > 1024 // MIN_ROLE_MENTION_LENGTH:
+                # Can't fit in a field, so skip building the mention string
+                roles_str = f"{len(roles)} roles"
+            else:
+                roles_str = ", ".join(role.mention for role in roles)
             
             embed = warning_embed(
                 title="Member Left",
-                description=f"{member.mention} (`{member.name}`) left the server"
+                description=f"{member.mention} (`{member.name}`) left the server",
+                footer=f"User ID: {member.id}",
+                timestamp=discord.utils.utcnow()
             )
             embed.set_thumbnail(url=member.display_avatar.url)
             embed.add_field(name="User ID", value=f"`{member.id}`", inline=True)
@@ -212,14 +434,10 @@ class LoggingSystem(commands.Cog):
                 value=f"{member.guild.member_count:,}",
                 inline=True
             )
-            embed.color = BRAND_PRIMARY
-            embed.set_footer(text=f"User ID: {member.id}")
-            embed.timestamp = discord.utils.utcnow()
-            
-            await channel.send(embed=embed)
+            self.queue_log(channel, embed)
             
         except Exception as e:
-            logger.error(f"Failed to log member leave for {member}: {e}", exc_info=True)
+            logger.error("Failed to log member leave for %s: %s", member, e, exc_info=True)
     
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message) -> None:
@@ -229,21 +447,24 @@ class LoggingSystem(commands.Cog):
             if not message.guild or message.author.bot:
                 return
             
-            channel = await self.get_message_logs_channel(message.guild)
-            if channel is None:
+            # Don't log deletions in the logs channel itself (checked before any await when cached)
+            state = self.guild_states.get(message.guild.id)
+            if state is not None and message.channel.id == state.channel_ids.get(MESSAGE_LOGS_CHANNEL_NAME):
                 return
             
-            # Check permissions
-            if not channel.permissions_for(message.guild.me).send_messages:
+            channel = await self.get_message_logs_channel(message.guild)
+            if channel is None or message.channel.id == channel.id:
                 return
             
-            # Don't log deletions in the logs channels themselves
-            if message.channel.id == channel.id:
+            # Check permissions
+            if not self.can_send(channel):
                 return
             
             embed = warning_embed(
                 title="Message Deleted",
-                description=f"Message deleted in {message.channel.mention}"
+                description=f"Message deleted in {message.channel.mention}",
+                footer=f"Message ID: {message.id} | User ID: {message.author.id}",
+                timestamp=message.created_at
             )
             embed.add_field(
                 name="Author",
@@ -263,21 +484,16 @@ class LoggingSystem(commands.Cog):
             
             # Add attachment info if any
             if message.attachments:
-                attachments = "\n".join([f"- {att.filename} ({att.size} bytes)" for att in message.attachments])
-                embed.add_field(name="Attachments", value=attachments[:1024], inline=False)
+                embed.add_field(name="Attachments", value=format_attachments(message.attachments), inline=False)
             
             # Add embed info if any
             if message.embeds:
                 embed.add_field(name="Embeds", value=f"{len(message.embeds)} embed(s)", inline=True)
             
-            embed.color = BRAND_PRIMARY
-            embed.set_footer(text=f"Message ID: {message.id} | User ID: {message.author.id}")
-            embed.timestamp = message.created_at
-            
-            await channel.send(embed=embed)
+            self.queue_log(channel, embed)
             
         except Exception as e:
-            logger.error(f"Failed to log message deletion: {e}", exc_info=True)
+            logger.error("Failed to log message deletion: %s", e, exc_info=True)
 
 
 async def setup(bot: "Bot") -> None:
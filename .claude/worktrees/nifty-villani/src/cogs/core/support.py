@@ -1,18 +1,28 @@
 """DM-based customer support ticket system for U-Drive."""
 
+import asyncio
+import io
 import json
 import logging
+import os
+import re
 import secrets
-import string
+import threading
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Dict
+from typing import TYPE_CHECKING, Optional, Dict, TextIO
 import discord
 from discord.ext import commands
 from discord import app_commands
 from src.utils.embeds import brand_embed, BRAND_PRIMARY
 from src.utils.ui import build_support_ticket_opened_embed, build_order_details_embed
 
+try:
+    import orjson  # Optional: faster tickets.json encode/decode.
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from src.bot import Bot
 
@@ -20,12 +30,89 @@ logger = logging.getLogger(__name__)
 
 # Configuration constants
 SUPPORT_CATEGORY_NAME = "Support Tickets"
+STAFF_LOG_CHANNEL_NAME = "ticket-logs"
 TICKETS_FILE = Path(__file__).parent.parent.parent.parent / "tickets.json"
+TICKETS_SAVE_DELAY = 1.0  # Seconds to collect ticket mapping changes into a single write
 TICKET_PREFIX = "support"
 SHORT_ID_LENGTH = 6
 SUPPORT_STAFF_ROLE_ID = 1454227177615655034  # Role ID for staff who can close tickets
 TRANSCRIPTS_DIR = Path(__file__).parent.parent.parent.parent / "transcripts"
 SUPPORT_CLOSE_CUSTOM_ID = "support_close_ticket"
+CHANNEL_NAME_TABLE = str.maketrans(" .", "--")  # Username separators Discord would not keep as-is
+CHANNEL_NAME_INVALID = re.compile(r"[^\w-]")  # Punctuation is dropped; Unicode letters and digits are kept
+STAFF_ROLE_PATTERN = re.compile(r"admin|staff|mod", re.IGNORECASE)  # Role names that grant ticket access
+TRANSCRIPT_WRITE_BATCH = 100  # Messages formatted per transcript file write
+TICKET_EVERYONE_OVERWRITE = discord.PermissionOverwrite(view_channel=False)
+TICKET_BOT_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=True,
+    read_message_history=True,
+    manage_messages=True
+)
+TICKET_STAFF_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=True,
+    read_message_history=True
+)
+ATTACHMENT_DOWNLOAD_CONCURRENCY = 4  # Attachment downloads in flight at once, across all relays
+STAFF_PING_MENTIONS = discord.AllowedMentions(roles=True, users=False, everyone=False, replied_user=False)
+
+
+# Fixed-text replies are built once; sending only serializes them
+INVALID_CONTEXT_EMBED = brand_embed("Invalid Context", "Use this button inside a support ticket channel.")
+STAFF_ROLE_REQUIRED_EMBED = brand_embed(
+    "Permission Denied",
+    "You need the support staff role to close tickets."
+)
+NOT_A_TICKET_EMBED = brand_embed("Error", "This channel is not a support ticket.")
+CLOSE_BUTTON_FAILED_EMBED = brand_embed("Error", "Could not close this ticket. Try again or use /close.")
+SUPPORT_UNAVAILABLE_EMBED = brand_embed(
+    "Support Unavailable",
+    "Sorry, support services are currently unavailable. Please try again later."
+)
+TICKET_CREATE_FAILED_EMBED = brand_embed(
+    "Support Unavailable",
+    "Sorry, we were unable to create your support ticket. Please try again later."
+)
+DELIVERY_FAILED_EMBED = brand_embed(
+    "Delivery Failed",
+    "Unable to deliver message to user. They may have DMs disabled."
+)
+ALREADY_CLOSING_EMBED = brand_embed("Already Closing", "This ticket is already being closed. Please wait...")
+INVALID_TICKET_EMBED = brand_embed("Error", "This channel is not a valid support ticket.")
+TRANSCRIPT_FAILED_EMBED = brand_embed(
+    "Error",
+    "Failed to generate transcript. Ticket not closed. Please try again."
+)
+DELETE_FORBIDDEN_EMBED = brand_embed(
+    "Warning",
+    "Ticket mappings removed, but channel could not be deleted due to missing permissions."
+)
+DELETE_FAILED_EMBED = brand_embed("Warning", "Ticket mappings removed, but channel deletion failed.")
+GUILD_ONLY_EMBED = brand_embed("Error", "This command can only be used in a server.")
+PERMISSIONS_UNVERIFIED_EMBED = brand_embed("Error", "Unable to verify your permissions.")
+CONFIG_ERROR_EMBED = brand_embed(
+    "Error",
+    "Support system configuration error. Please contact an administrator."
+)
+CLOSE_PERMISSION_DENIED_EMBED = brand_embed(
+    "Permission Denied",
+    "You do not have permission to close support tickets."
+)
+TEXT_CHANNEL_ONLY_EMBED = brand_embed("Error", "This command can only be used in a text channel.")
+NOT_A_TICKET_CHANNEL_EMBED = brand_embed("Error", "This channel is not a support ticket channel.")
+
+
+class TicketRecord:
+    """An open support ticket: the user it belongs to, its channel, and the ordered service if any."""
+    
+    __slots__ = ("user_id", "channel_id", "service", "user")
+    
+    def __init__(self, user_id: int, channel_id: int, service: Optional[str] = None) -> None:
+        self.user_id = user_id
+        self.channel_id = channel_id
+        self.service = service
+        self.user: Optional[discord.User] = None  # Resolved on first use; not persisted
 
 
 class CloseTicketView(discord.ui.View):
@@ -56,29 +143,17 @@ class CloseTicketView(discord.ui.View):
             return
 
         if not interaction.guild or not isinstance(interaction.user, discord.Member):
-            embed = self.support.create_brand_embed(
-                title="Invalid Context",
-                description="Use this button inside a support ticket channel.",
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=INVALID_CONTEXT_EMBED, ephemeral=True)
             return
 
-        staff_role = interaction.guild.get_role(SUPPORT_STAFF_ROLE_ID)
-        if not staff_role or staff_role not in interaction.user.roles:
-            embed = self.support.create_brand_embed(
-                title="Permission Denied",
-                description="You need the support staff role to close tickets.",
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        # Member.get_role checks the member's role id list directly instead of building member.roles
+        if interaction.user.get_role(SUPPORT_STAFF_ROLE_ID) is None:
+            await interaction.followup.send(embed=STAFF_ROLE_REQUIRED_EMBED, ephemeral=True)
             return
 
         channel = interaction.channel
         if not isinstance(channel, discord.TextChannel):
-            embed = self.support.create_brand_embed(
-                title="Error",
-                description="This channel is not a support ticket.",
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=NOT_A_TICKET_EMBED, ephemeral=True)
             return
 
         try:
@@ -90,13 +165,7 @@ class CloseTicketView(discord.ui.View):
                 exc,
                 exc_info=True,
             )
-            await interaction.followup.send(
-                embed=self.support.create_brand_embed(
-                    title="Error",
-                    description="Could not close this ticket. Try again or use /close.",
-                ),
-                ephemeral=True,
-            )
+            await interaction.followup.send(embed=CLOSE_BUTTON_FAILED_EMBED, ephemeral=True)
 
 class Support(commands.Cog):
     """Handles DM-based support tickets for U-Drive customer support."""
@@ -104,85 +173,228 @@ class Support(commands.Cog):
     def __init__(self, bot: "Bot") -> None:
         """Initialize the Support cog."""
         self.bot = bot
-        self.tickets: Dict[int, int] = {}  # user_id -> channel_id
-        self.channel_to_user: Dict[int, int] = {}  # channel_id -> user_id
+        self.tickets: Dict[int, TicketRecord] = {}  # channel_id -> ticket
+        self.user_tickets: Dict[int, int] = {}  # user_id -> channel_id
         self.closing_channels: set[int] = set()  # Track channels being closed to prevent duplicates
-        self.channel_service: Dict[int, str] = {}  # channel_id -> service name
+        self.support_guild_id: Optional[int] = None  # Guild DM tickets open in, resolved lazily
+        self.tickets_dirty = asyncio.Event()  # Set when mappings changed since the last write
+        self.tickets_write_lock = threading.Lock()  # Serializes writes from the saver thread and unload
+        self.save_task: Optional[asyncio.Task] = None
+        self.close_view = CloseTicketView(self)  # Persistent, so one instance serves every ticket
+        self.staff_role_ids: Dict[int, list[int]] = {}  # guild_id -> staff role ids, cleared on role changes
+        # guild_id -> ticket channel overwrites (everyone, bot, staff roles), cleared with staff_role_ids
+        self.overwrite_templates: Dict[int, dict[discord.Role | discord.Member, discord.PermissionOverwrite]] = {}
+        self.category_ids: Dict[int, int] = {}  # guild_id -> support category id
+        self.staff_log_channel_ids: Dict[int, int] = {}  # guild_id -> ticket-logs channel id
+        self.download_semaphore = asyncio.Semaphore(ATTACHMENT_DOWNLOAD_CONCURRENCY)
         # Ensure transcripts directory exists
         TRANSCRIPTS_DIR.mkdir(exist_ok=True)
         self.load_tickets()
 
     async def cog_load(self) -> None:
-        """Register the slash command and log load events."""
-        guild = discord.Object(id=self.bot.config.dev_guild_id) if self.bot.config.dev_guild_id else None
-
-        # Remove any stale registration to avoid duplicates
-        try:
-            existing = self.bot.tree.get_command("close", type=discord.AppCommandType.chat_input, guild=guild)
-            if existing:
-                self.bot.tree.remove_command("close", type=discord.AppCommandType.chat_input, guild=guild)
-                logger.info("Removed existing /close command before re-registering")
-        except Exception as exc:  # Defensive logging only
-            logger.warning(f"Failed to check/remove existing /close command: {exc}", exc_info=True)
-
-        try:
-            self.bot.tree.add_command(self.close_command, guild=guild)
-            scope = f"guild {guild.id}" if guild else "global scope"
-            logger.info(f"Registered /close slash command in {scope}")
-        except Exception as exc:
-            logger.error(f"Failed to register /close command: {exc}", exc_info=True)
-
+        """Register the persistent close view and log load events."""
         try:
-            self.bot.add_view(CloseTicketView(self))
+            self.bot.add_view(self.close_view)
             logger.info("Registered persistent CloseTicketView (Components v2)")
         except Exception as exc:
             logger.error("Failed to register persistent CloseTicketView: %s", exc, exc_info=True)
 
+        self.save_task = asyncio.create_task(self.save_tickets_loop())
+        if self.bot.is_ready():
+            self.prune_tickets()
         logger.info("Support cog loaded")
-
+    
     async def cog_unload(self) -> None:
-        """Cleanup command registration when the cog is unloaded."""
+        """Unregister /close, stop the background saver and flush any pending ticket changes."""
+        # remove_cog only ejects /close globally, so the dev-guild copy must be removed here
         guild = discord.Object(id=self.bot.config.dev_guild_id) if self.bot.config.dev_guild_id else None
         try:
             removed = self.bot.tree.remove_command("close", type=discord.AppCommandType.chat_input, guild=guild)
             if removed:
                 logger.info("Unregistered /close slash command during cog unload")
         except Exception as exc:
-            logger.warning(f"Failed to unregister /close command: {exc}", exc_info=True)
+            logger.warning("Failed to unregister /close command: %s", exc, exc_info=True)
+        
+        if self.save_task is not None:
+            self.save_task.cancel()
+            try:
+                await self.save_task
+            except asyncio.CancelledError:
+                pass
+        if self.tickets_dirty.is_set():
+            self.write_tickets(self.tickets_snapshot())
+    
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """Drop tickets whose channels went away while the bot was offline."""
+        self.prune_tickets()
+    
+    def channel_cache_complete(self) -> bool:
+        """Whether a channel cache miss means the channel is gone (ready, and no guild is unavailable)."""
+        return self.bot.is_ready() and not any(guild.unavailable for guild in self.bot.guilds)
+    
+    def prune_tickets(self) -> None:
+        """
+        Forget tickets whose channels are no longer in the cache.
+        
+        Keeps every stored channel id resolvable so handle_dm can trust a cache hit.
+        Skipped while any guild is unavailable, since its channels are missing from the cache.
+        """
+        if not self.channel_cache_complete():
+            return
+        stale = [channel_id for channel_id in self.tickets if self.bot.get_channel(channel_id) is None]
+        for channel_id in stale:
+            self.remove_ticket(channel_id)
+        if stale:
+            logger.info("Removed %d ticket mappings for deleted channels", len(stale))
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """Forget cached state for a guild the bot leaves."""
+        if self.support_guild_id == guild.id:
+            self.support_guild_id = None
+        self.forget_staff_roles(guild.id)
+        self.category_ids.pop(guild.id, None)
+        self.staff_log_channel_ids.pop(guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """Forget a ticket, support category or staff log channel when it is deleted."""
+        if channel.id in self.tickets:
+            self.remove_ticket(channel.id)
+        guild_id = channel.guild.id
+        if self.category_ids.get(guild_id) == channel.id:
+            del self.category_ids[guild_id]
+        elif self.staff_log_channel_ids.get(guild_id) == channel.id:
+            del self.staff_log_channel_ids[guild_id]
+    
+    def forget_staff_roles(self, guild_id: int) -> None:
+        """Drop a guild's cached staff roles and the ticket overwrites built from them."""
+        self.staff_role_ids.pop(guild_id, None)
+        self.overwrite_templates.pop(guild_id, None)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        """Forget cached staff roles when a role is created."""
+        self.forget_staff_roles(role.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """Forget cached staff roles when a role is deleted."""
+        self.forget_staff_roles(role.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """Forget cached staff roles when a role is renamed."""
+        if before.name != after.name:
+            self.forget_staff_roles(after.guild.id)
+    
+    def resolve_support_guild(self) -> Optional[discord.Guild]:
+        """
+        Get the guild that DM-opened tickets are created in.
+        
+        Uses dev_guild_id if configured, otherwise the first guild the bot is in.
+        Only the guild id is cached: a fresh READY replaces every Guild object, so the guild
+        itself is looked up on each call. The first-guild fallback for an unavailable dev guild
+        is not cached.
+        """
+        if self.support_guild_id is None:
+            dev_guild_id = self.bot.config.dev_guild_id
+            if dev_guild_id:
+                self.support_guild_id = dev_guild_id
+            elif self.bot.guilds:
+                self.support_guild_id = self.bot.guilds[0].id
+        
+        guild = self.bot.get_guild(self.support_guild_id) if self.support_guild_id is not None else None
+        if guild is None and self.bot.guilds:
+            return self.bot.guilds[0]
+        return guild
     
     def load_tickets(self) -> None:
         """Load ticket mappings from file."""
         try:
             if TICKETS_FILE.exists():
-                with open(TICKETS_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.tickets = {int(k): int(v) for k, v in data.get("tickets", {}).items()}
-                    self.channel_to_user = {int(k): int(v) for k, v in data.get("channel_to_user", {}).items()}
-                    self.channel_service = {int(k): v for k, v in data.get("channel_service", {}).items()}
-                logger.info(f"Loaded {len(self.tickets)} ticket(s) from storage")
+                with open(TICKETS_FILE, "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                services = data.get("channel_service", {})
+                for channel_id, user_id in data.get("channel_to_user", {}).items():
+                    record = TicketRecord(int(user_id), int(channel_id), services.get(channel_id))
+                    self.tickets[record.channel_id] = record
+                    self.user_tickets[record.user_id] = record.channel_id
+                logger.info("Loaded %s ticket(s) from storage", len(self.tickets))
         except Exception as e:
-            logger.error(f"Failed to load tickets: {e}", exc_info=True)
+            logger.error("Failed to load tickets: %s", e, exc_info=True)
             self.tickets = {}
-            self.channel_to_user = {}
-            self.channel_service = {}
+            self.user_tickets = {}
+    
+    def add_ticket(self, user: discord.User, channel_id: int, service: Optional[str] = None) -> None:
+        """Record a newly opened ticket and schedule a save."""
+        record = TicketRecord(user.id, channel_id, service)
+        record.user = user
+        self.tickets[channel_id] = record
+        self.user_tickets[user.id] = channel_id
+        self.save_tickets()
+    
+    async def get_ticket_user(self, record: TicketRecord) -> discord.User:
+        """
+        Get the user a ticket belongs to, fetching it at most once per ticket.
+        
+        Raises:
+            discord.NotFound: If the user no longer exists
+        """
+        if record.user is None:
+            record.user = self.bot.get_user(record.user_id) or await self.bot.fetch_user(record.user_id)
+        return record.user
+    
+    def remove_ticket(self, channel_id: int) -> None:
+        """Forget a ticket by channel and schedule a save."""
+        record = self.tickets.pop(channel_id, None)
+        if record is not None and self.user_tickets.get(record.user_id) == channel_id:
+            del self.user_tickets[record.user_id]
+        self.save_tickets()
     
     def save_tickets(self) -> None:
-        """Save ticket mappings to file."""
+        """Mark ticket mappings as changed; the background saver writes them shortly after."""
+        self.tickets_dirty.set()
+    
+    def tickets_snapshot(self) -> dict[str, dict[str, str]]:
+        """Copy the ticket mappings into their JSON form."""
+        records = self.tickets.values()
+        return {
+            "tickets": {str(r.user_id): str(r.channel_id) for r in records},
+            "channel_to_user": {str(r.channel_id): str(r.user_id) for r in records},
+            "channel_service": {str(r.channel_id): r.service for r in records if r.service},
+        }
+    
+    def write_tickets(self, data: dict[str, dict[str, str]]) -> None:
+        """Write a ticket snapshot to file, replacing it atomically."""
         try:
-            data = {
-                "tickets": {str(k): str(v) for k, v in self.tickets.items()},
-                "channel_to_user": {str(k): str(v) for k, v in self.channel_to_user.items()},
-                "channel_service": {str(k): v for k, v in self.channel_service.items()},
-            }
-            with open(TICKETS_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            tmp_file = TICKETS_FILE.with_suffix(".tmp")
+            with self.tickets_write_lock:
+                if orjson is not None:
+                    payload = orjson.dumps(data)
+                else:
+                    payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+                with open(tmp_file, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_file, TICKETS_FILE)
         except Exception as e:
-            logger.error(f"Failed to save tickets: {e}", exc_info=True)
+            logger.error("Failed to save tickets: %s", e, exc_info=True)
+    
+    async def save_tickets_loop(self) -> None:
+        """Write ticket mappings off the event loop, batching changes made within TICKETS_SAVE_DELAY."""
+        while True:
+            await self.tickets_dirty.wait()
+            await asyncio.sleep(TICKETS_SAVE_DELAY)
+            self.tickets_dirty.clear()
+            # Snapshot on the loop so the thread never iterates dicts that are being mutated
+            await asyncio.to_thread(self.write_tickets, self.tickets_snapshot())
     
     def generate_short_id(self) -> str:
         """Generate a short random ID for ticket channel naming."""
-        alphabet = string.ascii_lowercase + string.digits
-        return ''.join(secrets.choice(alphabet) for _ in range(SHORT_ID_LENGTH))
+        # One urandom draw formatted in C, rather than a per-character secrets.choice loop
+        return secrets.token_hex((SHORT_ID_LENGTH + 1) // 2)[:SHORT_ID_LENGTH]
     
     async def get_support_category(self, guild: discord.Guild) -> Optional[discord.CategoryChannel]:
         """
@@ -194,14 +406,22 @@ class Support(commands.Cog):
         Returns:
             The category channel, or None if creation failed
         """
+        # Check cache first (get_channel is a dict lookup, unlike scanning guild.categories)
+        category_id = self.category_ids.get(guild.id)
+        if category_id is not None:
+            cached = guild.get_channel(category_id)
+            if isinstance(cached, discord.CategoryChannel):
+                return cached
+        
         # Try to find existing category
-        for category in guild.categories:
-            if category.name == SUPPORT_CATEGORY_NAME:
-                return category
+        category = discord.utils.get(guild.categories, name=SUPPORT_CATEGORY_NAME)
+        if category is not None:
+            self.category_ids[guild.id] = category.id
+            return category
         
         # Create new category if we have permission
         if not guild.me.guild_permissions.manage_channels:
-            logger.warning(f"Bot lacks manage_channels permission in {guild.name}. Cannot create support category.")
+            logger.warning("Bot lacks manage_channels permission in %s. Cannot create support category.", guild.name)
             return None
         
         try:
@@ -209,10 +429,11 @@ class Support(commands.Cog):
                 SUPPORT_CATEGORY_NAME,
                 reason="Auto-create support tickets category"
             )
-            logger.info(f"Created support category '{SUPPORT_CATEGORY_NAME}' in {guild.name}")
+            self.category_ids[guild.id] = category.id
+            logger.info("Created support category '%s' in %s", SUPPORT_CATEGORY_NAME, guild.name)
             return category
         except discord.HTTPException as e:
-            logger.error(f"Failed to create support category in {guild.name}: {e}", exc_info=True)
+            logger.error("Failed to create support category in %s: %s", guild.name, e, exc_info=True)
             return None
     
     async def get_staff_roles(self, guild: discord.Guild) -> list[discord.Role]:
@@ -227,13 +448,35 @@ class Support(commands.Cog):
         Returns:
             List of staff roles
         """
-        staff_roles = []
-        for role in guild.roles:
-            role_name_lower = role.name.lower()
-            if any(keyword in role_name_lower for keyword in ['admin', 'staff', 'mod', 'moderator']):
-                staff_roles.append(role)
+        role_ids = self.staff_role_ids.get(guild.id)
+        if role_ids is not None:
+            return [role for role in map(guild.get_role, role_ids) if role is not None]
+        
+        staff_roles = [role for role in guild.roles if STAFF_ROLE_PATTERN.search(role.name)]
+        self.staff_role_ids[guild.id] = [role.id for role in staff_roles]
         return staff_roles
     
+    async def get_ticket_overwrites(
+        self,
+        guild: discord.Guild
+    ) -> dict[discord.Role | discord.Member, discord.PermissionOverwrite]:
+        """Get the shared ticket channel overwrites for a guild, building them on first use."""
+        overwrites = self.overwrite_templates.get(guild.id)
+        if overwrites is not None:
+            return overwrites
+        
+        overwrites = {
+            guild.default_role: TICKET_EVERYONE_OVERWRITE,
+            guild.me: TICKET_BOT_OVERWRITE,
+        }
+        
+        # Add staff roles
+        for role in await self.get_staff_roles(guild):
+            overwrites[role] = TICKET_STAFF_OVERWRITE
+        
+        self.overwrite_templates[guild.id] = overwrites
+        return overwrites
+    
     async def create_ticket_channel(
         self,
         guild: discord.Guild,
@@ -251,39 +494,22 @@ class Support(commands.Cog):
         """
         # Check permissions
         if not guild.me.guild_permissions.manage_channels:
-            logger.warning(f"Bot lacks manage_channels permission in {guild.name}. Cannot create ticket channel.")
+            logger.warning("Bot lacks manage_channels permission in %s. Cannot create ticket channel.", guild.name)
             return None
         
         # Get or create category
         category = await self.get_support_category(guild)
         if category is None:
-            logger.error(f"Failed to get/create support category in {guild.name}")
+            logger.error("Failed to get/create support category in %s", guild.name)
             return None
         
         # Generate channel name
-        username_clean = user.name.lower().replace(' ', '-')[:20]  # Clean and truncate
+        username_clean = CHANNEL_NAME_INVALID.sub("", user.name.lower().translate(CHANNEL_NAME_TABLE))[:20] or "user"
         short_id = self.generate_short_id()
         channel_name = f"{TICKET_PREFIX}-{username_clean}-{short_id}"
         
-        # Set up permissions
-        overwrites = {
-            guild.default_role: discord.PermissionOverwrite(view_channel=False),
-            guild.me: discord.PermissionOverwrite(
-                view_channel=True,
-                send_messages=True,
-                read_message_history=True,
-                manage_messages=True
-            )
-        }
-        
-        # Add staff roles
-        staff_roles = await self.get_staff_roles(guild)
-        for role in staff_roles:
-            overwrites[role] = discord.PermissionOverwrite(
-                view_channel=True,
-                send_messages=True,
-                read_message_history=True
-            )
+        # Set up permissions (copied from the per-guild template)
+        overwrites = dict(await self.get_ticket_overwrites(guild))
         
         try:
             channel = await guild.create_text_channel(
@@ -292,12 +518,29 @@ class Support(commands.Cog):
                 overwrites=overwrites,
                 reason=f"Support ticket created for {user} (ID: {user.id})"
             )
-            logger.info(f"Created support ticket channel {channel.name} for user {user} (ID: {user.id})")
+            logger.info("Created support ticket channel %s for user %s (ID: %s)", channel.name, user, user.id)
             return channel
         except discord.HTTPException as e:
-            logger.error(f"Failed to create ticket channel in {guild.name}: {e}", exc_info=True)
+            logger.error("Failed to create ticket channel in %s: %s", guild.name, e, exc_info=True)
             return None
     
+    async def download_attachment(self, attachment: discord.Attachment) -> discord.File:
+        """Download one attachment, waiting for a free download slot."""
+        async with self.download_semaphore:
+            return await attachment.to_file()
+    
+    async def download_attachments(self, attachments: list[discord.Attachment]) -> list[discord.File]:
+        """Download up to 10 attachments concurrently, skipping any that fail."""
+        attachments = attachments[:10]  # Limit to 10 attachments
+        results = await asyncio.gather(*map(self.download_attachment, attachments), return_exceptions=True)
+        files = []
+        for att, result in zip(attachments, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to download attachment %s: %s", att.filename, result)
+            else:
+                files.append(result)
+        return files
+    
     def create_brand_embed(self, title: str, description: str = "") -> discord.Embed:
         """Create an embed using U-Drive primary brand color."""
         return brand_embed(title=title, description=description, color=BRAND_PRIMARY)
@@ -312,19 +555,27 @@ class Support(commands.Cog):
         Returns:
             The text channel, or None if creation failed
         """
-        channel_name = "ticket-logs"
+        channel_name = STAFF_LOG_CHANNEL_NAME
+        
+        # Check cache first (get_channel is a dict lookup, unlike scanning guild.channels)
+        channel_id = self.staff_log_channel_ids.get(guild.id)
+        if channel_id is not None:
+            cached = guild.get_channel(channel_id)
+            if isinstance(cached, discord.TextChannel):
+                return cached
         
         # Try to find existing channel
-        for channel in guild.channels:
-            if isinstance(channel, discord.TextChannel) and channel.name == channel_name:
-                return channel
+        channel = discord.utils.get(guild.text_channels, name=channel_name)
+        if channel is not None:
+            self.staff_log_channel_ids[guild.id] = channel.id
+            return channel
         
         # Get or create support category
         category = await self.get_support_category(guild)
         
         # Create new channel if we have permission
         if not guild.me.guild_permissions.manage_channels:
-            logger.warning(f"Bot lacks manage_channels permission in {guild.name}. Cannot create staff log channel.")
+            logger.warning("Bot lacks manage_channels permission in %s. Cannot create staff log channel.", guild.name)
             return None
         
         try:
@@ -348,12 +599,51 @@ class Support(commands.Cog):
                 overwrites=overwrites,
                 reason="Auto-create ticket logs channel"
             )
-            logger.info(f"Created staff log channel '{channel_name}' in {guild.name}")
+            self.staff_log_channel_ids[guild.id] = channel.id
+            logger.info("Created staff log channel '%s' in %s", channel_name, guild.name)
             return channel
         except discord.HTTPException as e:
-            logger.error(f"Failed to create staff log channel in {guild.name}: {e}", exc_info=True)
+            logger.error("Failed to create staff log channel in %s: %s", guild.name, e, exc_info=True)
             return None
     
+    @staticmethod
+    def format_transcript_entry(message: discord.Message) -> str:
+        """Format one message as a transcript block, preceded by its blank separator line."""
+        # Format timestamp
+        timestamp = message.created_at.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
+        
+        # Format author
+        if message.author.bot:
+            author_str = f"[BOT] {message.author.name} ({message.author.id})"
+        else:
+            author_str = f"{message.author.name} ({message.author.id})"
+        
+        # Add message header
+        lines = ["", f"[{timestamp} UTC] {author_str}"]
+        
+        # Add message content
+        if message.content:
+            lines.append(f"Content: {message.content}")
+        else:
+            lines.append("Content: [No text content]")
+        
+        # Add attachments
+        if message.attachments:
+            lines.append("Attachments:")
+            for att in message.attachments:
+                lines.append(f"  - {att.filename}: {att.url} ({att.size} bytes)")
+        
+        # Add embeds info
+        if message.embeds:
+            lines.append(f"Embeds: {len(message.embeds)} embed(s)")
+        
+        return "\n".join(lines) + "\n"
+    
+    @classmethod
+    def write_transcript_batch(cls, f: TextIO, messages: list[discord.Message]) -> None:
+        """Format a batch of messages and write them to an open transcript file."""
+        f.writelines(map(cls.format_transcript_entry, messages))
+    
     async def generate_transcript(self, channel: discord.TextChannel) -> Optional[Path]:
         """
         Generate a transcript of all messages in the ticket channel.
@@ -370,62 +660,36 @@ class Support(commands.Cog):
             transcript_filename = f"{channel_name}.txt"
             transcript_path = TRANSCRIPTS_DIR / transcript_filename
             
-            # Fetch all messages (oldest first)
-            messages = []
-            async for message in channel.history(limit=None, oldest_first=True):
-                messages.append(message)
-            
-            # Generate transcript content
-            transcript_lines = [
+            header = "\n".join([
                 f"{'='*60}",
                 f"U-Drive Support Ticket Transcript",
                 f"Channel: {channel_name}",
                 f"Channel ID: {channel.id}",
-                f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}",
+                f"Generated: {datetime.utcnow().isoformat(sep=' ', timespec='seconds')} UTC",
                 f"{'='*60}",
                 ""
-            ]
-            
-            for message in messages:
-                # Format timestamp
-                timestamp = message.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')
-                
-                # Format author
-                if message.author.bot:
-                    author_str = f"[BOT] {message.author.name} ({message.author.id})"
-                else:
-                    author_str = f"{message.author.name} ({message.author.id})"
-                
-                # Add message header
-                transcript_lines.append(f"[{timestamp}] {author_str}")
-                
-                # Add message content
-                if message.content:
-                    transcript_lines.append(f"Content: {message.content}")
-                else:
-                    transcript_lines.append("Content: [No text content]")
-                
-                # Add attachments
-                if message.attachments:
-                    transcript_lines.append("Attachments:")
-                    for att in message.attachments:
-                        transcript_lines.append(f"  - {att.filename}: {att.url} ({att.size} bytes)")
-                
-                # Add embeds info
-                if message.embeds:
-                    transcript_lines.append(f"Embeds: {len(message.embeds)} embed(s)")
-                
-                transcript_lines.append("")  # Empty line between messages
+            ])
             
-            # Write transcript to file
-            transcript_content = "\n".join(transcript_lines)
-            with open(transcript_path, "w", encoding="utf-8") as f:
-                f.write(transcript_content)
+            # Stream messages (oldest first) to the file in batches instead of holding the whole transcript;
+            # opening, each batch's format and write, and the final flush all run off the event loop
+            f = await asyncio.to_thread(open, transcript_path, "w", encoding="utf-8")
+            try:
+                f.write(header)
+                batch: list[discord.Message] = []
+                async for message in channel.history(limit=None, oldest_first=True):
+                    batch.append(message)
+                    if len(batch) >= TRANSCRIPT_WRITE_BATCH:
+                        await asyncio.to_thread(self.write_transcript_batch, f, batch)
+                        batch = []
+                if batch:
+                    await asyncio.to_thread(self.write_transcript_batch, f, batch)
+            finally:
+                await asyncio.to_thread(f.close)
             
-            logger.info(f"Generated transcript for channel {channel.name} ({channel.id})")
+            logger.info("Generated transcript for channel %s (%s)", channel.name, channel.id)
             return transcript_path
         except Exception as e:
-            logger.error(f"Failed to generate transcript for channel {channel.id}: {e}", exc_info=True)
+            logger.error("Failed to generate transcript for channel %s: %s", channel.id, e, exc_info=True)
             return None
     
     async def send_ticket_opened_message(
@@ -442,9 +706,7 @@ class Support(commands.Cog):
                 try:
                     await channel.send(
                         content=staff_role.mention,
-                        allowed_mentions=discord.AllowedMentions(
-                            roles=True, users=False, everyone=False, replied_user=False
-                        ),
+                        allowed_mentions=STAFF_PING_MENTIONS,
                     )
                 except discord.Forbidden:
                     logger.warning(
@@ -464,11 +726,10 @@ class Support(commands.Cog):
                 logger.warning("Staff role %s not found in guild %s", SUPPORT_STAFF_ROLE_ID, channel.guild.id if channel.guild else "unknown")
 
             embed = build_support_ticket_opened_embed(user, service_name)
-            view = CloseTicketView(self)
-            await channel.send(embed=embed, view=view)
+            await channel.send(embed=embed, view=self.close_view)
             logger.info("Attached CloseTicketView to support channel %s", channel.id)
         except Exception as e:
-            logger.error(f"Failed to send ticket opened message: {e}", exc_info=True)
+            logger.error("Failed to send ticket opened message: %s", e, exc_info=True)
     
     async def send_user_confirmation(
         self,
@@ -493,12 +754,13 @@ class Support(commands.Cog):
             embed.set_footer(text="U-Drive Support")
             embed.timestamp = discord.utils.utcnow()
             
-            await user.send(embed=embed)
-            logger.info(f"Sent ticket confirmation to user {user} (ID: {user.id})")
+            dm_channel = await user.create_dm()
+            await dm_channel.send(embed=embed)
+            logger.info("Sent ticket confirmation to user %s (ID: %s)", user, user.id)
         except discord.Forbidden:
-            logger.warning(f"Cannot send DM to user {user} (ID: {user.id}) - DMs may be disabled")
+            logger.warning("Cannot send DM to user %s (ID: %s) - DMs may be disabled", user, user.id)
         except Exception as e:
-            logger.error(f"Failed to send confirmation to user {user}: {e}", exc_info=True)
+            logger.error("Failed to send confirmation to user %s: %s", user, e, exc_info=True)
     
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
@@ -507,69 +769,61 @@ class Support(commands.Cog):
         if message.author.bot:
             return
         
+        # Handle messages in ticket channels (staff replies); other guild traffic stops at one dict check
+        if message.guild is not None:
+            record = self.tickets.get(message.channel.id)
+            if record is not None:
+                await self.handle_ticket_channel_message(message, record)
+            return
+        
         # Handle DMs (ticket creation and message relay)
         if isinstance(message.channel, discord.DMChannel):
             await self.handle_dm(message)
-        # Handle messages in ticket channels (staff replies)
-        elif isinstance(message.channel, discord.TextChannel) and message.guild:
-            await self.handle_ticket_channel_message(message)
     
     async def handle_dm(self, message: discord.Message) -> None:
         """Handle DM messages from users."""
         user = message.author
         
         # Check if user already has an active ticket
-        if user.id in self.tickets:
-            channel_id = self.tickets[user.id]
-            try:
-                channel = self.bot.get_channel(channel_id)
-                if channel is None:
+        channel_id = self.user_tickets.get(user.id)
+        if channel_id is not None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None and not self.channel_cache_complete():
+                # The ticket's guild may just be missing from the cache; ask the API before
+                # treating the ticket as gone, so an outage does not open a duplicate
+                try:
                     channel = await self.bot.fetch_channel(channel_id)
-                
-                # Verify channel still exists and is accessible
-                if channel and isinstance(channel, discord.TextChannel):
-                    # Relay message to ticket channel
-                    await self.relay_dm_to_ticket(message, channel, user)
+                except discord.NotFound:
+                    channel = None
+                except Exception as e:
+                    logger.error("Error checking existing ticket for user %s: %s", user.id, e, exc_info=True)
+                    try:
+                        dm_channel = await user.create_dm()
+                        await dm_channel.send(embed=SUPPORT_UNAVAILABLE_EMBED)
+                    except Exception:
+                        pass
                     return
-                else:
-                    # Channel doesn't exist, remove from mapping
-                    logger.warning(f"Ticket channel {channel_id} no longer exists, removing mapping")
-                    self.tickets.pop(user.id, None)
-                    self.channel_to_user.pop(channel_id, None)
-                    self.channel_service.pop(channel_id, None)
-                    self.save_tickets()
-            except discord.NotFound:
-                # Channel was deleted, remove from mapping
-                logger.info(f"Ticket channel {channel_id} not found, removing mapping")
-                self.tickets.pop(user.id, None)
-                self.channel_to_user.pop(channel_id, None)
-                self.channel_service.pop(channel_id, None)
-                self.save_tickets()
-            except Exception as e:
-                logger.error(f"Error checking existing ticket for user {user.id}: {e}", exc_info=True)
+            
+            if isinstance(channel, discord.TextChannel):
+                await self.relay_dm_to_ticket(message, channel, user)
+                return
+            
+            # The ticket channel is gone; drop its mapping before opening a new one
+            logger.info("Ticket channel %s no longer exists, removing mapping", channel_id)
+            self.remove_ticket(channel_id)
         
         # Create new ticket for first message
         await self.create_new_ticket(message, user)
     
     async def create_new_ticket(self, message: discord.Message, user: discord.User, service_name: Optional[str] = None) -> None:
         """Create a new support ticket from a user's DM."""
-        # Find the support server (use the first guild the bot is in, or configurable)
-        # For now, use dev_guild_id if available, otherwise first guild
-        guild = None
-        if self.bot.config.dev_guild_id:
-            guild = self.bot.get_guild(self.bot.config.dev_guild_id)
-        
-        if guild is None and self.bot.guilds:
-            guild = self.bot.guilds[0]
-        
+        # Find the support server (dev_guild_id if available, otherwise first guild)
+        guild = self.resolve_support_guild()
         if guild is None:
             logger.error("No guild available to create support ticket")
             try:
-                error_embed = self.create_brand_embed(
-                    title="Support Unavailable",
-                    description="Sorry, support services are currently unavailable. Please try again later."
-                )
-                await user.send(embed=error_embed)
+                dm_channel = await user.create_dm()
+                await dm_channel.send(embed=SUPPORT_UNAVAILABLE_EMBED)
             except Exception:
                 pass
             return
@@ -577,32 +831,27 @@ class Support(commands.Cog):
         # Create ticket channel
         channel = await self.create_ticket_channel(guild, user)
         if channel is None:
-            logger.error(f"Failed to create ticket channel for user {user.id}")
+            logger.error("Failed to create ticket channel for user %s", user.id)
             try:
-                error_embed = self.create_brand_embed(
-                    title="Support Unavailable",
-                    description="Sorry, we were unable to create your support ticket. Please try again later."
-                )
-                await user.send(embed=error_embed)
+                dm_channel = await user.create_dm()
+                await dm_channel.send(embed=TICKET_CREATE_FAILED_EMBED)
             except Exception:
                 pass
             return
         
         # Store ticket mapping
-        self.tickets[user.id] = channel.id
-        self.channel_to_user[channel.id] = user.id
-        if service_name:
-            self.channel_service[channel.id] = service_name
-        self.save_tickets()
+        self.add_ticket(user, channel.id, service_name)
         
-        # Send initial ticket message
-        await self.send_ticket_opened_message(channel, user, service_name=service_name)
+        async def post_ticket_messages() -> None:
+            # The opened message must land above the user's first message
+            await self.send_ticket_opened_message(channel, user, service_name=service_name)
+            await self.relay_dm_to_ticket(message, channel, user)
         
-        # Relay the user's initial message
-        await self.relay_dm_to_ticket(message, channel, user)
-        
-        # Send confirmation to user
-        await self.send_user_confirmation(user, channel, service_name=service_name)
+        # The staff-channel posts and the user's DM are independent round-trips
+        await asyncio.gather(
+            post_ticket_messages(),
+            self.send_user_confirmation(user, channel, service_name=service_name),
+        )
     
     async def create_ticket_from_order(
         self,
@@ -623,8 +872,8 @@ class Support(commands.Cog):
         Returns:
             The created ticket channel or None on failure
         """
-        if user.id in self.tickets:
-            existing_channel_id = self.tickets[user.id]
+        existing_channel_id = self.user_tickets.get(user.id)
+        if existing_channel_id is not None:
             existing_channel = self.bot.get_channel(existing_channel_id)
             if existing_channel is None:
                 try:
@@ -639,24 +888,26 @@ class Support(commands.Cog):
         if channel is None:
             return None
         
-        self.tickets[user.id] = channel.id
-        self.channel_to_user[channel.id] = user.id
-        self.channel_service[channel.id] = service_name
-        self.save_tickets()
+        self.add_ticket(user, channel.id, service_name)
         
         try:
             await channel.edit(topic=f"Service: {service_name}")
         except Exception as exc:
             logger.warning("Failed to set topic for channel %s: %s", channel.id, exc)
         
-        await self.send_ticket_opened_message(channel, user, service_name=service_name)
-        
-        # Send details to staff channel
-        if details:
-            detail_embed = build_order_details_embed(service_name, user, details)
-            await channel.send(embed=detail_embed)
+        async def post_ticket_messages() -> None:
+            await self.send_ticket_opened_message(channel, user, service_name=service_name)
+            
+            # Send details to staff channel
+            if details:
+                detail_embed = build_order_details_embed(service_name, user, details)
+                await channel.send(embed=detail_embed)
         
-        await self.send_user_confirmation(user, channel, service_name=service_name)
+        # The staff-channel posts and the user's DM are independent round-trips
+        await asyncio.gather(
+            post_ticket_messages(),
+            self.send_user_confirmation(user, channel, service_name=service_name),
+        )
         return channel
     
     async def relay_dm_to_ticket(
@@ -676,65 +927,47 @@ class Support(commands.Cog):
             
             # Add attachment info if any
             if message.attachments:
-                attachment_info = []
-                for att in message.attachments[:5]:  # Limit to 5 attachments in embed
-                    attachment_info.append(f"[{att.filename}]({att.url}) ({att.size} bytes)")
                 embed.add_field(
                     name="Attachments",
-                    value="\n".join(attachment_info),
+                    # Limit to 5 attachments in embed
+                    value="\n".join(f"[{att.filename}]({att.url}) ({att.size} bytes)" for att in islice(message.attachments, 5)),
                     inline=False
                 )
                 # Try to forward attachments (may fail if too large or rate-limited)
                 try:
-                    files = []
-                    for att in message.attachments[:10]:  # Limit to 10 attachments
-                        try:
-                            files.append(await att.to_file())
-                        except Exception as e:
-                            logger.warning(f"Failed to download attachment {att.filename}: {e}")
+                    files = await self.download_attachments(message.attachments)
                     if files:
                         await channel.send(embed=embed, files=files)
                     else:
                         await channel.send(embed=embed)
                 except discord.HTTPException as e:
                     # If sending with files fails, send embed only
-                    logger.warning(f"Failed to send attachments, sending embed only: {e}")
+                    logger.warning("Failed to send attachments, sending embed only: %s", e)
                     await channel.send(embed=embed)
             else:
                 await channel.send(embed=embed)
             
-            logger.info(f"Relayed DM from user {user.id} to ticket channel {channel.id}")
+            logger.info("Relayed DM from user %s to ticket channel %s", user.id, channel.id)
         except discord.Forbidden:
-            logger.warning(f"Cannot send message to ticket channel {channel.id} - missing permissions")
+            logger.warning("Cannot send message to ticket channel %s - missing permissions", channel.id)
         except Exception as e:
-            logger.error(f"Failed to relay DM to ticket channel: {e}", exc_info=True)
+            logger.error("Failed to relay DM to ticket channel: %s", e, exc_info=True)
     
-    async def handle_ticket_channel_message(self, message: discord.Message) -> None:
-        """Handle messages in ticket channels (relay staff replies to user DMs)."""
+    async def handle_ticket_channel_message(self, message: discord.Message, record: TicketRecord) -> None:
+        """Handle a non-bot message in a ticket channel (relay staff replies to user DMs)."""
         channel = message.channel
         
-        # Check if this is a ticket channel
-        if channel.id not in self.channel_to_user:
-            return
-        
-        # Ignore if message is from bot
-        if message.author.bot:
-            return
-        
         # Get user ID from channel mapping
-        user_id = self.channel_to_user[channel.id]
+        user_id = record.user_id
         
         try:
-            user = await self.bot.fetch_user(user_id)
+            user = await self.get_ticket_user(record)
         except discord.NotFound:
-            logger.warning(f"User {user_id} not found, removing ticket mapping")
-            self.tickets.pop(user_id, None)
-            self.channel_to_user.pop(channel.id, None)
-            self.channel_service.pop(channel.id, None)
-            self.save_tickets()
+            logger.warning("User %s not found, removing ticket mapping", user_id)
+            self.remove_ticket(channel.id)
             return
         except Exception as e:
-            logger.error(f"Failed to fetch user {user_id}: {e}", exc_info=True)
+            logger.error("Failed to fetch user %s: %s", user_id, e, exc_info=True)
             return
         
         # Relay staff message to user DM
@@ -749,47 +982,102 @@ class Support(commands.Cog):
             
             # Add attachment info if any
             if message.attachments:
-                attachment_info = []
-                for att in message.attachments[:5]:  # Limit to 5 in embed
-                    attachment_info.append(f"[{att.filename}]({att.url})")
                 embed.add_field(
                     name="Attachments",
-                    value="\n".join(attachment_info),
+                    # Limit to 5 in embed
+                    value="\n".join(f"[{att.filename}]({att.url})" for att in islice(message.attachments, 5)),
                     inline=False
                 )
+                dm_channel = await user.create_dm()
                 # Try to forward attachments
                 try:
-                    files = []
-                    for att in message.attachments[:10]:  # Limit to 10 attachments
-                        try:
-                            files.append(await att.to_file())
-                        except Exception as e:
-                            logger.warning(f"Failed to download attachment {att.filename}: {e}")
+                    files = await self.download_attachments(message.attachments)
                     if files:
-                        await user.send(embed=embed, files=files)
+                        await dm_channel.send(embed=embed, files=files)
                     else:
-                        await user.send(embed=embed)
+                        await dm_channel.send(embed=embed)
                 except discord.HTTPException as e:
                     # If sending with files fails, send embed only
-                    logger.warning(f"Failed to send attachments to user, sending embed only: {e}")
-                    await user.send(embed=embed)
+                    logger.warning("Failed to send attachments to user, sending embed only: %s", e)
+                    await dm_channel.send(embed=embed)
             else:
-                await user.send(embed=embed)
+                dm_channel = await user.create_dm()
+                await dm_channel.send(embed=embed)
             
-            logger.info(f"Relayed staff message from {message.author.id} to user {user_id} via DM")
+            logger.info("Relayed staff message from %s to user %s via DM", message.author.id, user_id)
         except discord.Forbidden:
-            logger.warning(f"Cannot send DM to user {user_id} - user may have DMs disabled")
+            logger.warning("Cannot send DM to user %s - user may have DMs disabled", user_id)
             # Optionally notify in the channel
             try:
-                error_embed = self.create_brand_embed(
-                    title="Delivery Failed",
-                    description=f"Unable to deliver message to user. They may have DMs disabled."
-                )
-                await channel.send(embed=error_embed)
+                await channel.send(embed=DELIVERY_FAILED_EMBED)
             except Exception:
                 pass
         except Exception as e:
-            logger.error(f"Failed to relay staff message to user {user_id}: {e}", exc_info=True)
+            logger.error("Failed to relay staff message to user %s: %s", user_id, e, exc_info=True)
+    
+    async def send_closure_dm(self, user: Optional[discord.User], transcript_name: str, transcript: bytes) -> None:
+        """DM the user that their ticket was closed, attaching the transcript if possible."""
+        if user is None:
+            return
+        try:
+            close_embed = self.create_brand_embed(
+                title="Support Ticket Closed",
+                description=(
+                    "Your U-Drive support ticket has been closed.\n\n"
+                    "If you need further assistance, please feel free to send us a new message."
+                )
+            )
+            close_embed.set_footer(text="U-Drive Support")
+            close_embed.timestamp = discord.utils.utcnow()
+            
+            # Attach transcript if possible
+            dm_channel = await user.create_dm()
+            try:
+                await dm_channel.send(
+                    embed=close_embed,
+                    file=discord.File(io.BytesIO(transcript), filename=transcript_name)
+                )
+            except discord.HTTPException:
+                # If sending with file fails, send embed only
+                await dm_channel.send(embed=close_embed)
+        except discord.Forbidden:
+            logger.warning("Cannot send closure DM to user %s - DMs may be disabled", user.id)
+        except Exception as e:
+            logger.error("Failed to send closure message to user %s: %s", user.id, e, exc_info=True)
+    
+    async def log_ticket_closure(
+        self,
+        channel: discord.TextChannel,
+        user_id: int,
+        staff_member: discord.Member,
+        transcript_name: str,
+        transcript: bytes
+    ) -> None:
+        """Post the closure record and transcript to the staff log channel."""
+        if not channel.guild:
+            return
+        log_channel = await self.get_or_create_staff_log_channel(channel.guild)
+        if not log_channel:
+            return
+        try:
+            log_embed = self.create_brand_embed(
+                title="Ticket Closed",
+                description=f"Support ticket `{channel.name}` has been closed."
+            )
+            log_embed.add_field(name="Channel ID", value=f"`{channel.id}`", inline=True)
+            log_embed.add_field(name="User ID", value=f"`{user_id}`", inline=True)
+            log_embed.add_field(name="Closed By", value=f"{staff_member.mention} (`{staff_member.name}`)", inline=False)
+            log_embed.add_field(name="Staff ID", value=f"`{staff_member.id}`", inline=True)
+            log_embed.timestamp = discord.utils.utcnow()
+            
+            # Send transcript to log channel
+            await log_channel.send(
+                embed=log_embed,
+                file=discord.File(io.BytesIO(transcript), filename=transcript_name)
+            )
+            logger.info("Logged ticket closure for channel %s (%s)", channel.name, channel.id)
+        except Exception as e:
+            logger.error("Failed to log ticket closure: %s", e, exc_info=True)
     
     async def close_ticket(
         self,
@@ -809,11 +1097,7 @@ class Support(commands.Cog):
         
         # Check if channel is already being closed
         if channel_id in self.closing_channels:
-            embed = self.create_brand_embed(
-                title="Already Closing",
-                description="This ticket is already being closed. Please wait..."
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=ALREADY_CLOSING_EMBED, ephemeral=True)
             return
         
         # Mark as closing
@@ -821,21 +1105,18 @@ class Support(commands.Cog):
         
         try:
             # Get user ID from mapping
-            user_id = self.channel_to_user.get(channel_id)
-            if not user_id:
-                embed = self.create_brand_embed(
-                    title="Error",
-                    description="This channel is not a valid support ticket."
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
+            record = self.tickets.get(channel_id)
+            if record is None:
+                await interaction.followup.send(embed=INVALID_TICKET_EMBED, ephemeral=True)
                 self.closing_channels.discard(channel_id)
                 return
+            user_id = record.user_id
             
             # Fetch user
             try:
-                user = await self.bot.fetch_user(user_id)
+                user = await self.get_ticket_user(record)
             except discord.NotFound:
-                logger.warning(f"User {user_id} not found when closing ticket")
+                logger.warning("User %s not found when closing ticket", user_id)
                 user = None
             
             # Generate transcript BEFORE deletion
@@ -843,89 +1124,32 @@ class Support(commands.Cog):
             
             if not transcript_path:
                 # If transcript generation failed, don't delete the channel
-                embed = self.create_brand_embed(
-                    title="Error",
-                    description="Failed to generate transcript. Ticket not closed. Please try again."
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=TRANSCRIPT_FAILED_EMBED, ephemeral=True)
                 self.closing_channels.discard(channel_id)
                 return
             
-            # Send closure message to user via DM
-            if user:
-                try:
-                    close_embed = self.create_brand_embed(
-                        title="Support Ticket Closed",
-                        description=(
-                            "Your U-Drive support ticket has been closed.\n\n"
-                            "If you need further assistance, please feel free to send us a new message."
-                        )
-                    )
-                    close_embed.set_footer(text="U-Drive Support")
-                    close_embed.timestamp = discord.utils.utcnow()
-                    
-                    # Attach transcript if possible
-                    try:
-                        await user.send(
-                            embed=close_embed,
-                            file=discord.File(transcript_path, filename=transcript_path.name)
-                        )
-                    except discord.HTTPException:
-                        # If sending with file fails, send embed only
-                        await user.send(embed=close_embed)
-                except discord.Forbidden:
-                    logger.warning(f"Cannot send closure DM to user {user_id} - DMs may be disabled")
-                except Exception as e:
-                    logger.error(f"Failed to send closure message to user {user_id}: {e}", exc_info=True)
+            # Read the transcript once; each send gets its own in-memory file
+            transcript = await asyncio.to_thread(transcript_path.read_bytes)
             
-            # Log closure to staff log channel
-            if channel.guild:
-                log_channel = await self.get_or_create_staff_log_channel(channel.guild)
-                if log_channel:
-                    try:
-                        log_embed = self.create_brand_embed(
-                            title="Ticket Closed",
-                            description=f"Support ticket `{channel.name}` has been closed."
-                        )
-                        log_embed.add_field(name="Channel ID", value=f"`{channel_id}`", inline=True)
-                        log_embed.add_field(name="User ID", value=f"`{user_id}`", inline=True)
-                        log_embed.add_field(name="Closed By", value=f"{staff_member.mention} (`{staff_member.name}`)", inline=False)
-                        log_embed.add_field(name="Staff ID", value=f"`{staff_member.id}`", inline=True)
-                        log_embed.timestamp = discord.utils.utcnow()
-                        
-                        # Send transcript to log channel
-                        await log_channel.send(
-                            embed=log_embed,
-                            file=discord.File(transcript_path, filename=transcript_path.name)
-                        )
-                        logger.info(f"Logged ticket closure for channel {channel.name} ({channel_id})")
-                    except Exception as e:
-                        logger.error(f"Failed to log ticket closure: {e}", exc_info=True)
+            # The user's DM and the staff log post are independent; deletion waits for both
+            await asyncio.gather(
+                self.send_closure_dm(user, transcript_path.name, transcript),
+                self.log_ticket_closure(channel, user_id, staff_member, transcript_path.name, transcript),
+            )
             
             # Remove from ticket mappings
-            self.tickets.pop(user_id, None)
-            self.channel_to_user.pop(channel_id, None)
-            self.channel_service.pop(channel_id, None)
-            self.save_tickets()
+            self.remove_ticket(channel_id)
             
             # Delete the channel
             try:
                 await channel.delete(reason=f"Ticket closed by {staff_member} ({staff_member.id})")
-                logger.info(f"Deleted ticket channel {channel.name} ({channel_id})")
+                logger.info("Deleted ticket channel %s (%s)", channel.name, channel_id)
             except discord.Forbidden:
-                logger.error(f"Cannot delete channel {channel_id} - missing permissions")
-                embed = self.create_brand_embed(
-                    title="Warning",
-                    description="Ticket mappings removed, but channel could not be deleted due to missing permissions."
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
+                logger.error("Cannot delete channel %s - missing permissions", channel_id)
+                await interaction.followup.send(embed=DELETE_FORBIDDEN_EMBED, ephemeral=True)
             except Exception as e:
-                logger.error(f"Failed to delete channel {channel_id}: {e}", exc_info=True)
-                embed = self.create_brand_embed(
-                    title="Warning",
-                    description="Ticket mappings removed, but channel deletion failed."
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
+                logger.error("Failed to delete channel %s: %s", channel_id, e, exc_info=True)
+                await interaction.followup.send(embed=DELETE_FAILED_EMBED, ephemeral=True)
             
             # Send success confirmation
             success_embed = self.create_brand_embed(
@@ -947,57 +1171,32 @@ class Support(commands.Cog):
         
         # Check if in a guild
         if not interaction.guild:
-            embed = self.create_brand_embed(
-                title="Error",
-                description="This command can only be used in a server."
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=GUILD_ONLY_EMBED, ephemeral=True)
             return
         
         # Check if user has the required role
         member = interaction.user
         if not isinstance(member, discord.Member):
-            embed = self.create_brand_embed(
-                title="Error",
-                description="Unable to verify your permissions."
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=PERMISSIONS_UNVERIFIED_EMBED, ephemeral=True)
             return
         
-        staff_role = interaction.guild.get_role(SUPPORT_STAFF_ROLE_ID)
-        if not staff_role:
-            logger.warning(f"Staff role {SUPPORT_STAFF_ROLE_ID} not found in guild {interaction.guild.id}")
-            embed = self.create_brand_embed(
-                title="Error",
-                description="Support system configuration error. Please contact an administrator."
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
-            return
-        
-        if staff_role not in member.roles:
-            embed = self.create_brand_embed(
-                title="Permission Denied",
-                description="You do not have permission to close support tickets."
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        # Holding the role implies it exists, so the guild lookup only runs to explain a denial
+        if member.get_role(SUPPORT_STAFF_ROLE_ID) is None:
+            if interaction.guild.get_role(SUPPORT_STAFF_ROLE_ID) is None:
+                logger.warning("Staff role %s not found in guild %s", SUPPORT_STAFF_ROLE_ID, interaction.guild.id)
+                await interaction.followup.send(embed=CONFIG_ERROR_EMBED, ephemeral=True)
+            else:
+                await interaction.followup.send(embed=CLOSE_PERMISSION_DENIED_EMBED, ephemeral=True)
             return
         
         # Check if this is a ticket channel
         channel = interaction.channel
         if not isinstance(channel, discord.TextChannel):
-            embed = self.create_brand_embed(
-                title="Error",
-                description="This command can only be used in a text channel."
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=TEXT_CHANNEL_ONLY_EMBED, ephemeral=True)
             return
         
-        if channel.id not in self.channel_to_user:
-            embed = self.create_brand_embed(
-                title="Error",
-                description="This channel is not a support ticket channel."
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        if channel.id not in self.tickets:
+            await interaction.followup.send(embed=NOT_A_TICKET_CHANNEL_EMBED, ephemeral=True)
             return
         
         # Close the ticket
@@ -1006,5 +1205,7 @@ class Support(commands.Cog):
 
 async def setup(bot: "Bot") -> None:
     """Setup function for the Support cog."""
-    await bot.add_cog(Support(bot))
+    # add_cog registers /close on the tree, scoped to the dev guild when set; cog_unload removes it.
+    guild = discord.Object(id=bot.config.dev_guild_id) if bot.config.dev_guild_id else None
+    await bot.add_cog(Support(bot), guild=guild)
 
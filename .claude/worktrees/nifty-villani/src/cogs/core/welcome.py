@@ -1,11 +1,13 @@
 """Welcome system for new members."""
 
 import logging
+import time
 from typing import TYPE_CHECKING
 import discord
 from discord.ext import commands
 
 from src.utils.embeds import success_embed
+from src.utils.ui import account_created_timestamp
 
 if TYPE_CHECKING:
     from src.bot import Bot
@@ -15,6 +17,9 @@ logger = logging.getLogger(__name__)
 # Target channel ID for welcome messages
 WELCOME_CHANNEL_ID = 1411380862477668372
 
+# Seconds to wait before fetching the welcome channel again after it was missing or inaccessible
+FETCH_RETRY_DELAY = 300
+
 
 class Welcome(commands.Cog):
     """Handles welcome messages for new members."""
@@ -22,34 +27,45 @@ class Welcome(commands.Cog):
     def __init__(self, bot: "Bot") -> None:
         """Initialize the Welcome cog."""
         self.bot = bot
+        self.fetch_retry_at = 0.0  # monotonic time the channel may be fetched again after a failure
     
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
         """Called when a member joins a guild."""
         try:
-            # Get the welcome channel
+            # Get the welcome channel from the gateway cache (a dict lookup) on every join, so the
+            # object is never one orphaned by a fresh READY
             channel = self.bot.get_channel(WELCOME_CHANNEL_ID)
             if channel is None:
+                # A failed fetch is not repeated for every join during a raid
+                if time.monotonic() < self.fetch_retry_at:
+                    logger.debug("Welcome channel unavailable; skipping welcome message for %s", member)
+                    return
+                
                 # Try fetching if not in cache
                 try:
                     channel = await self.bot.fetch_channel(WELCOME_CHANNEL_ID)
                 except discord.NotFound:
+                    self.fetch_retry_at = time.monotonic() + FETCH_RETRY_DELAY
                     logger.warning(
-                        f"Welcome channel {WELCOME_CHANNEL_ID} not found. "
-                        f"Skipping welcome message for {member}."
+                        "Welcome channel %s not found. Skipping welcome message for %s.",
+                        WELCOME_CHANNEL_ID,
+                        member,
                     )
                     return
                 except discord.Forbidden:
+                    self.fetch_retry_at = time.monotonic() + FETCH_RETRY_DELAY
                     logger.warning(
-                        f"No permission to access welcome channel {WELCOME_CHANNEL_ID}. "
-                        f"Skipping welcome message for {member}."
+                        "No permission to access welcome channel %s. Skipping welcome message for %s.",
+                        WELCOME_CHANNEL_ID,
+                        member,
                     )
                     return
             
             # Check if we can send messages to the channel
             if not channel.permissions_for(member.guild.me).send_messages:
                 logger.warning(
-                    f"Bot lacks permission to send messages in welcome channel {WELCOME_CHANNEL_ID}."
+                    "Bot lacks permission to send messages in welcome channel %s.", WELCOME_CHANNEL_ID
                 )
                 return
             
@@ -66,7 +82,7 @@ class Welcome(commands.Cog):
             )
             embed.add_field(
                 name="Account Created",
-                value=f"<t:{int(member.created_at.timestamp())}:R>",
+                value=account_created_timestamp(member),
                 inline=True
             )
             embed.set_footer(text=f"User ID: {member.id}")
@@ -74,12 +90,12 @@ class Welcome(commands.Cog):
             
             # Send welcome message
             await channel.send(embed=embed)
-            logger.info(f"Sent welcome message for {member} ({member.id}) in {member.guild.name}")
+            logger.info("Sent welcome message for %s (%s) in %s", member, member.id, member.guild.name)
             
         except discord.HTTPException as e:
-            logger.error(f"Failed to send welcome message for {member}: {e}", exc_info=True)
+            logger.error("Failed to send welcome message for %s: %s", member, e, exc_info=True)
         except Exception as e:
-            logger.error(f"Unexpected error in welcome system for {member}: {e}", exc_info=True)
+            logger.error("Unexpected error in welcome system for %s: %s", member, e, exc_info=True)
 
 
 async def setup(bot: "Bot") -> None:
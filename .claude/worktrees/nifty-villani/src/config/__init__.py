@@ -3,14 +3,21 @@
 import json
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+CONFIG_PATH = Path(__file__).parent.parent.parent / "config.json"
 
 
 class Config:
     """Loads and manages bot configuration from config.json or environment variables."""
     
+    __slots__ = ("_file_config", "token", "application_id", "dev_guild_id", "prefix", "sync_commands")
+    
     def __init__(self) -> None:
         """Initialize configuration from file or environment variables."""
+        # config.json is parsed once and every key is served from it
+        self._file_config: Optional[dict[str, Any]] = self._load_file_config()
+        
         self.token: str = self._get_config("token")
         self.application_id: int = int(self._get_config("application_id", required=True))
         
@@ -22,6 +29,14 @@ class Config:
         sync_str = self._get_config("sync_commands", default="true")
         self.sync_commands: bool = sync_str.lower() in ("true", "1", "yes")
     
+    @staticmethod
+    def _load_file_config() -> Optional[dict[str, Any]]:
+        """Read config.json, or return None if it does not exist."""
+        if not CONFIG_PATH.exists():
+            return None
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
     def _get_config(self, key: str, default: Optional[str] = None, required: bool = True) -> str:
         """
         Get configuration value from config.json (prioritized) or environment variable.
@@ -39,29 +54,24 @@ class Config:
         Raises:
             ValueError: If required key is missing
         """
+        config = self._file_config
+        
         # For token, ONLY use config.json (never environment variables)
         if key == "token":
-            config_path = Path(__file__).parent.parent.parent / "config.json"
-            if not config_path.exists():
+            if config is None:
                 raise ValueError(
                     "config.json not found. Please create config.json with your bot token."
                 )
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                if key not in config or not config[key]:
-                    raise ValueError(
-                        f"Missing required configuration: {key}. "
-                        f"Please add '{key}' to config.json"
-                    )
-                return str(config[key])
+            if key not in config or not config[key]:
+                raise ValueError(
+                    f"Missing required configuration: {key}. "
+                    f"Please add '{key}' to config.json"
+                )
+            return str(config[key])
         
         # For other config values: Try config.json first, then environment variables
-        config_path = Path(__file__).parent.parent.parent / "config.json"
-        if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                if key in config and config[key]:
-                    return str(config[key])
+        if config is not None and config.get(key):
+            return str(config[key])
         
         # Try environment variable as fallback
         env_key = f"DISCORD_{key.upper()}"
@@ -9,7 +9,14 @@ BRAND_PRIMARY = discord.Color.from_rgb(244, 246, 251)  # #F4F6FB
 BRAND_ACCENT = discord.Color.from_rgb(63, 169, 245)    # #3FA9F5
 
 
-def brand_embed(title: str, description: str = "", *, color: discord.Color = BRAND_PRIMARY, **kwargs) -> Embed:
+def brand_embed(
+    title: str,
+    description: str = "",
+    *,
+    color: discord.Color = BRAND_PRIMARY,
+    footer: Optional[str] = None,
+    **kwargs
+) -> Embed:
     """
     Create a brand-aligned embed.
 
@@ -17,12 +24,16 @@ def brand_embed(title: str, description: str = "", *, color: discord.Color = BRA
         title: Embed title
         description: Embed description
         color: Border color to use (defaults to U-Drive primary)
-        **kwargs: Additional embed kwargs
+        footer: Optional footer text
+        **kwargs: Additional embed kwargs (e.g. timestamp)
 
     Returns:
         Discord Embed object
     """
-    return Embed(title=title, description=description, color=color, **kwargs)
+    embed = Embed(title=title, description=description, color=color, **kwargs)
+    if footer is not None:
+        embed.set_footer(text=footer)
+    return embed
 
 
 def success_embed(title: str, description: str = "", **kwargs) -> Embed:
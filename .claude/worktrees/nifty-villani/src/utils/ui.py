@@ -5,74 +5,72 @@ import discord
 
 from src.utils.embeds import brand_embed, BRAND_ACCENT
 
+RELATIVE_TIMESTAMP = "<t:%d:R>"  # Discord relative-time markup for a Unix timestamp
+
+
+def account_created_timestamp(user: discord.abc.Snowflake) -> str:
+    """Relative-time markup for when an account was created, read from its snowflake id."""
+    return RELATIVE_TIMESTAMP % (((user.id >> 22) + discord.utils.DISCORD_EPOCH) // 1000)
+
 
 def sectioned_embed(
     *,
     title: str,
     subtitle: Optional[str] = None,
     action_text: Optional[str] = None,
-    fields: Optional[Iterable[tuple[str, str, bool]]] = None,
+    fields: Iterable[tuple[str, str, bool]] = (),
     color: discord.Color = BRAND_ACCENT,
 ) -> discord.Embed:
     """
     Create a clean, minimal embed that follows the design sections:
     title -> subtitle -> action prompt -> optional fields.
     """
-    description_lines: list[str] = []
-    if subtitle:
-        description_lines.append(f"**{subtitle}**")
-    if action_text:
-        description_lines.append(action_text)
-
-    embed = brand_embed(title=title, description="\n".join(description_lines), color=color)
-    if fields:
-        for name, value, inline in fields:
-            embed.add_field(name=name, value=value, inline=inline)
-    return embed
-
+    if subtitle and action_text:
+        description = f"**{subtitle}**\n{action_text}"
+    elif subtitle:
+        description = f"**{subtitle}**"
+    else:
+        description = action_text or ""
 
-def build_order_menu_embed() -> discord.Embed:
-    """Embed for the order menu dropdown."""
-    return sectioned_embed(
-        title="U-Drive Orders",
-        subtitle="Choose a service to start",
-        action_text="Select an option below to open an order ticket.",
-        fields=[
-            ("Standard Ride", "Pickup and drop-off (limo & blackout tiers).", False),
-            ("Getaway Driver", "Emergency pickup when evading police.", False),
-            ("Transit Services", "Public transportation (bus services).", False),
-        ],
-    )
+    embed = brand_embed(title=title, description=description, color=color)
+    for name, value, inline in fields:
+        embed.add_field(name=name, value=value, inline=inline)
+    return embed
 
 
 def build_support_ticket_opened_embed(user: discord.User, service_name: Optional[str] = None) -> discord.Embed:
     """Embed for newly opened support tickets."""
+    user_str = str(user)
     fields = [
         ("User ID", f"`{user.id}`", True),
-        ("Account Created", f"<t:{int(user.created_at.timestamp())}:R>", True),
+        ("Account Created", account_created_timestamp(user), True),
     ]
     if service_name:
         fields.append(("Service", service_name, True))
 
     embed = sectioned_embed(
         title="Support Ticket Opened",
-        subtitle=str(user),
+        subtitle=user_str,
         action_text="Reply in this channel to message the user. Use the control below to close the ticket.",
         fields=fields,
     )
-    embed.set_author(name=str(user), icon_url=user.display_avatar.url)
+    embed.set_author(name=user_str, icon_url=user.display_avatar.url)
     embed.timestamp = discord.utils.utcnow()
     return embed
 
 
 def build_order_details_embed(service_label: str, user: discord.User, details: dict[str, str]) -> discord.Embed:
     """Embed summarizing order details inside a ticket channel."""
-    lines = []
-    if roblox_username := details.get("roblox_username"):
-        lines.append(f"**Roblox Username:** {roblox_username}")
-    if location := details.get("location"):
-        lines.append(f"**Location:** {location}")
-    body = "\n".join(lines) if lines else "No additional details provided."
+    roblox_username = details.get("roblox_username")
+    location = details.get("location")
+    if roblox_username and location:
+        body = f"**Roblox Username:** {roblox_username}\n**Location:** {location}"
+    elif roblox_username:
+        body = f"**Roblox Username:** {roblox_username}"
+    elif location:
+        body = f"**Location:** {location}"
+    else:
+        body = "No additional details provided."
 
     embed = sectioned_embed(
         title=f"Order Ticket - {service_label}",